@@ -2,20 +2,291 @@
 
 from __future__ import annotations
 
+import atexit
 import json
+import mmap
+import os
+import queue
+import re
+import threading
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 import datetime as _dt
+import time
+
+# orjson is optional: it is much faster than the stdlib json module and
+# produces bytes directly, which is what the writer thread wants anyway.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 # Base directory = repo root (same idea as in config.py)
 ROOT_DIR = Path(__file__).resolve().parent.parent
 LOG_DIR = ROOT_DIR / "logs"
 LOG_FILE = LOG_DIR / "activity.log"
+# Previous generation of the log; activity.log is rotated here once it
+# exceeds MAX_LOG_BYTES, so disk usage stays bounded at ~2x that size.
+LOG_BACKUP_FILE = LOG_DIR / "activity.log.1"
+
+# Plain-str copies for the os.* calls on the write/read paths, so no
+# Path objects are built or converted per call.
+LOG_DIR_STR = str(LOG_DIR)
+LOG_FILE_STR = str(LOG_FILE)
+LOG_BACKUP_FILE_STR = str(LOG_BACKUP_FILE)
+MAX_LOG_BYTES = 8 * 1024 * 1024
+
+# Background writer state.
+# log_event() only serializes + enqueues; a single daemon thread drains the
+# queue and writes whole batches to a file descriptor kept open for the
+# lifetime of the process.
+_BATCH_MAX = 512  # stays below IOV_MAX (1024) so a batch fits one writev()
+
+_QUEUE: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+_WRITER: Optional[threading.Thread] = None
+_WRITER_LOCK = threading.Lock()
+_FD: Optional[int] = None
+_FD_SIZE = 0  # current size of the file behind _FD
+_FD_LOCK = threading.Lock()
+
+# O_BINARY matters on Windows: without it the CRT translates "\n" to "\r\n".
+# Vectored writes are POSIX-only; Windows falls back to join + write
+_HAS_WRITEV = hasattr(os, "writev")
+
+_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to compact JSON bytes (orjson if available)."""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS: int etc. keys become strings, as with json.dumps
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson if available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# (epoch second, formatted ISO string) for the last _now_iso() call
+_LAST_ISO: tuple[int, str] = (-1, "")
 
 
 def _now_iso() -> str:
-    """Return current UTC time as ISO string (seconds precision)."""
-    return _dt.datetime.utcnow().isoformat(timespec="seconds")
+    """
+    Return current UTC time as ISO string (seconds precision).
+    The formatted string is cached per wall-clock second, so bursts of
+    calls within the same second skip the datetime construction.
+    """
+    global _LAST_ISO
+    sec = int(time.time())
+    cached_sec, cached_iso = _LAST_ISO
+    if sec != cached_sec:
+        cached_iso = _dt.datetime.utcfromtimestamp(sec).isoformat()
+        _LAST_ISO = (sec, cached_iso)
+    return cached_iso
+
+
+def _ensure_writer() -> None:
+    """Start the background writer thread on first use."""
+    global _WRITER
+    if _WRITER is not None:
+        return
+    with _WRITER_LOCK:
+        if _WRITER is None:
+            thread = threading.Thread(
+                target=_writer_loop,
+                name="activity-log-writer",
+                daemon=True,
+            )
+            thread.start()
+            _WRITER = thread
+            atexit.register(_shutdown)
+
+
+def _close_fd() -> None:
+    global _FD
+    with _FD_LOCK:
+        if _FD is not None:
+            try:
+                os.close(_FD)
+            except OSError:
+                pass
+            _FD = None
+
+
+def _get_fd() -> int:
+    """
+    Return the shared log file descriptor, opening it on first use.
+
+    The file is opened with O_APPEND, so each os.write() lands contiguously
+    at the current end of file even if another process appends as well.
+    """
+    global _FD, _FD_SIZE
+    with _FD_LOCK:
+        if _FD is None:
+            # Only runs on (re)open: a logs/ dir deleted underneath us is
+            # recreated when _write_lines notices the stale descriptor.
+            os.makedirs(LOG_DIR_STR, exist_ok=True)
+            _FD = os.open(LOG_FILE_STR, _OPEN_FLAGS, 0o644)
+            _FD_SIZE = os.fstat(_FD).st_size
+        return _FD
+
+
+def _rotate() -> None:
+    """
+    Move activity.log to activity.log.1 (replacing the older backup).
+    The next write reopens a fresh activity.log.
+    """
+    _close_fd()
+    try:
+        os.replace(LOG_FILE_STR, LOG_BACKUP_FILE_STR)
+    except OSError as exc:
+        # e.g. a reader still has the file open on Windows; retry next batch
+        print(f"[activity_log] Failed to rotate log file: {exc}")
+
+
+def _write_all(fd: int, lines: List[bytes]) -> int:
+    """
+    Write all lines to fd, normally with one syscall, and return the
+    number of bytes written. Where os.writev() exists the lines are
+    handed to the kernel as-is (no join copy); elsewhere (Windows)
+    they are joined into a single os.write() payload.
+    """
+    total = sum(map(len, lines))
+    if _HAS_WRITEV:
+        written = os.writev(fd, lines)
+        if written == total:
+            return total
+        rest = memoryview(b"".join(lines))[written:]
+    else:
+        rest = memoryview(b"".join(lines))
+
+    # Short write: push out the remainder
+    while rest:
+        written = os.write(fd, rest)
+        rest = rest[written:]
+    return total
+
+
+def _fd_is_stale(fd: int) -> bool:
+    """
+    True if fd no longer refers to the file at LOG_FILE_STR, i.e.
+    activity.log (or logs/) was deleted, moved or replaced outside this
+    module. Writes to such a descriptor succeed on POSIX but go to an
+    orphaned file, so they have to be detected rather than caught.
+    """
+    try:
+        st_fd = os.fstat(fd)
+        st_path = os.stat(LOG_FILE_STR)
+    except FileNotFoundError:
+        return True
+    return (
+        st_fd.st_nlink == 0
+        or st_fd.st_ino != st_path.st_ino
+        or st_fd.st_dev != st_path.st_dev
+    )
+
+
+def _write_lines(lines: List[bytes]) -> None:
+    """Write a batch of serialized lines with a single syscall."""
+    if not lines:
+        return
+    global _FD_SIZE
+    try:
+        if _FD is not None and _fd_is_stale(_FD):
+            # Log file or directory removed/rotated underneath us: reopen
+            _close_fd()
+        try:
+            written = _write_all(_get_fd(), lines)
+        except OSError:
+            # e.g. the descriptor went bad between the check and the write
+            _close_fd()
+            written = _write_all(_get_fd(), lines)
+    except Exception as exc:
+        # Logging should never crash the app; just print a warning.
+        print(f"[activity_log] Failed to write log entries: {exc}")
+        return
+
+    _FD_SIZE += written
+    if _FD_SIZE > MAX_LOG_BYTES:
+        _rotate()
+
+
+def _writer_loop() -> None:
+    """
+    Drain the queue in batches of up to _BATCH_MAX lines and write each
+    batch at once. flush() markers in the queue are acknowledged after
+    everything queued before them has been written.
+    """
+    while True:
+        batch = [_QUEUE.get()]
+        while len(batch) < _BATCH_MAX:
+            try:
+                batch.append(_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+
+        lines: List[bytes] = []
+        for entry in batch:
+            if isinstance(entry, threading.Event):
+                _write_lines(lines)
+                lines = []
+                entry.set()
+            else:
+                lines.append(entry)
+        _write_lines(lines)
+
+
+def flush(timeout: float = 2.0) -> None:
+    """
+    Block until every event logged so far has been written to disk.
+    """
+    if _WRITER is None or not _WRITER.is_alive():
+        return
+    done = threading.Event()
+    _QUEUE.put(done)
+    done.wait(timeout)
+
+
+# Event types that can be written into the JSON line without escaping
+_PLAIN_EVENT_TYPE_RE = re.compile(r"[A-Z0-9_]+")
+
+
+def _dump_entry(timestamp: str, event_type: str, message: str, extra: Dict[str, Any]) -> bytes:
+    """
+    Serialize one log entry as a JSON line.
+
+    Every entry has the same four keys, so the common case is assembled
+    directly: the timestamp (from _now_iso) and upper-case event types
+    need no escaping, and only message/extra go through the JSON encoder.
+    Other event types fall back to encoding the whole dict.
+    """
+    if not _PLAIN_EVENT_TYPE_RE.fullmatch(event_type):
+        entry = {
+            "timestamp": timestamp,
+            "event_type": event_type,
+            "message": message,
+            "extra": extra,
+        }
+        return _dumps(entry) + b"\n"
+
+    return b"".join((
+        b'{"timestamp":"', timestamp.encode("ascii"),
+        b'","event_type":"', event_type.encode("ascii"),
+        b'","message":', _dumps(message),
+        b',"extra":', _dumps(extra),
+        b"}\n",
+    ))
+
+
+def _shutdown() -> None:
+    """atexit hook: write out pending entries, then close the log file."""
+    flush()
+    _close_fd()
 
 
 def log_event(event_type: str, message: str, extra: Dict[str, Any] | None = None) -> None:
@@ -23,60 +294,165 @@ def log_event(event_type: str, message: str, extra: Dict[str, Any] | None = None
     Append a log entry to logs/activity.log.
     Format per line (JSON):
       {"timestamp": "...", "event_type": "...", "message": "...", "extra": {...}}
+
+    The entry is written asynchronously by a background thread; no file I/O
+    happens on the caller's thread.
+    """
+    try:
+        line = _dump_entry(_now_iso(), event_type, message, extra or {})
+    except Exception as exc:
+        print(f"[activity_log] Failed to serialize log entry: {exc}")
+        return
+
+    _ensure_writer()
+    _QUEUE.put_nowait(line)
+
+
+# Every line starts with this (see _dump_entry), followed by the timestamp
+_TS_PREFIX = b'{"timestamp":"'
+
+
+def _tail_lines(path: str, limit: int, since: Optional[bytes] = None) -> Tuple[List[bytes], bool]:
     """
-    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    Return the last 'limit' non-empty lines of a log file (like tail -n).
+    A missing file yields an empty list.
+
+    If 'since' (an encoded ISO timestamp) is given, the scan also stops at
+    the first line older than it; the second return value tells whether
+    that happened. The timestamp is read straight from the line prefix,
+    so lines are only parsed once they are known to be wanted.
+
+    The file is memory-mapped and scanned backwards with rfind(), so only
+    the pages holding the requested tail are ever faulted in.
 
-    entry = {
-      "timestamp": _now_iso(),
-      "event_type": event_type,
-      "message": message,
-      "extra": extra or {},
-    }
+    Framing: every record is exactly one line, because JSON escapes any
+    newline inside a string value. "\n" is therefore a reliable record
+    separator in both directions. A torn trailing record (e.g. after a
+    crash mid-write) just fails to parse and is skipped.
+    """
+    if limit <= 0:
+        return [], False
 
     try:
-        with LOG_FILE.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
-    except Exception as exc:
-        # Logging should never crash the app; just print a warning.
-        print(f"[activity_log] Failed to write log entry: {exc}")
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return [], False
 
+    reached_since = False
+    ts_start = len(_TS_PREFIX)
+    ts_end = ts_start + len(since) if since is not None else 0
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            # mmap cannot map an empty file
+            return [], False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lines: List[bytes] = []
+            end = size
+            while end > 0 and len(lines) < limit:
+                nl = mm.rfind(b"\n", 0, end)
+                line = mm[nl + 1:end]
+                end = nl if nl >= 0 else 0
+                if not line.strip():
+                    continue
+                if (
+                    since is not None
+                    and line.startswith(_TS_PREFIX)
+                    and line[ts_start:ts_end] < since
+                ):
+                    reached_since = True
+                    break
+                lines.append(line)
 
-def get_recent_events(limit: int = 100) -> List[Dict[str, Any]]:
+    lines.reverse()
+    return lines, reached_since
+
+
+def get_log_version() -> Tuple[int, int]:
     """
-    Read up to 'limit' most recent events from the log file and return as dicts.
-    If the file doesn't exist yet, return an empty list.
+    Return a token, (mtime_ns, size) of the log file, that changes
+    whenever new events are written (or the file rotates). Callers can
+    compare it with a previous value to skip re-reading an unchanged log.
+
+    This is a plain stat() and never waits for the writer thread (cheap
+    enough for a UI poll); events still queued change the token once
+    they have been written.
     """
-    if not LOG_FILE.exists():
-        return []
+    try:
+        st = os.stat(LOG_FILE_STR)
+    except OSError:
+        return (0, 0)
+    return (st.st_mtime_ns, st.st_size)
 
+
+def get_recent_events(limit: int = 100, since_ts: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Read up to 'limit' most recent events from the log file and return as dicts.
+    If no log file exists yet, return an empty list.
+
+    If 'since_ts' (an ISO timestamp as written by log_event) is given, only
+    events with timestamp >= since_ts are returned. The bound is inclusive
+    because timestamps have one-second resolution: callers polling for new
+    events must skip the ones they already have at exactly since_ts.
+    The backward scan stops at the first older event, so polling for new
+    events costs only the bytes written since the last poll.
+
+    Events still queued for the writer thread are not waited for; call
+    flush() first if they must be included.
+    """
     events: List[Dict[str, Any]] = []
 
+    since = since_ts.encode("ascii") if since_ts is not None else None
     try:
-        with LOG_FILE.open("r", encoding="utf-8") as f:
-            lines = f.readlines()
+        lines, reached_since = _tail_lines(LOG_FILE_STR, limit, since)
+        # Just after a rotation the current file may be short; top up
+        # from the previous generation.
+        if len(lines) < limit and not reached_since:
+            older, _ = _tail_lines(LOG_BACKUP_FILE_STR, limit - len(lines), since)
+            lines = older + lines
     except Exception as exc:
         print(f"[activity_log] Failed to read log file: {exc}")
         return []
 
-    # Take last 'limit' lines
-    for line in lines[-limit:]:
-        line = line.strip()
-        if not line:
-            continue
+    if not lines:
+        return events
+
+    # Fast path: parse all lines in one go as a JSON array
+    try:
+        parsed = _loads(b"[" + b",".join(lines) + b"]")
+    except ValueError:
+        pass
+    else:
+        return _events_since(parsed, since_ts)
+
+    # Some line is malformed: parse one by one to find and skip it
+    for line in lines:
         try:
-            evt = json.loads(line)
+            evt = _loads(line)
             events.append(evt)
-        except json.JSONDecodeError:
+        except ValueError:
             # Skip malformed lines
             continue
 
-    return events
+    return _events_since(events, since_ts)
+
+
+def _events_since(events: List[Dict[str, Any]], since_ts: Optional[str]) -> List[Dict[str, Any]]:
+    """Drop events older than since_ts (events are oldest first)."""
+    if since_ts is None:
+        return events
+    # Same fixed-width ISO format, so string order is time order
+    for i, evt in enumerate(events):
+        if evt.get("timestamp", "") >= since_ts:
+            return events[i:] if i else events
+    return []
 
 
 if __name__ == "__main__":
     # Simple self-test
     log_event("TEST", "This is a test event", {"foo": "bar"})
+    flush()
     recent = get_recent_events(limit=5)
     print("Recent events:")
     for e in recent:
-        print(e)
\ No newline at end of file
+        print(e)
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import json
+import os
+import tempfile
+import threading
 from json import JSONDecodeError
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from .models import FullConfig, AppInfo, ProfileConfig, AppRule, Action, Direction
 
@@ -13,6 +16,15 @@ from .models import FullConfig, AppInfo, ProfileConfig, AppRule, Action, Directi
 ROOT_DIR = Path(__file__).resolve().parent.parent
 CONFIG_PATH = ROOT_DIR / "config.json"
 
+# In-process cache for load_config():
+#   str(CONFIG_PATH) -> ((st_mtime_ns, st_size), raw dict)
+# A hit requires the file to be unchanged on disk since it was parsed/saved.
+# The raw dict is only ever read (parse_full_config copies what it keeps),
+# so every caller still gets its own FullConfig.
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+# Serializes writes (UI thread and background workers may both save)
+_SAVE_LOCK = threading.RLock()
+
 
 def _default_raw_config() -> Dict[str, Any]:
     """
@@ -63,10 +75,30 @@ def load_raw_config() -> Dict[str, Any]:
 def save_raw_config(cfg: Dict[str, Any]) -> None:
     """
     Save the given dict to config.json (pretty-printed JSON).
+
+    The JSON is written to a temp file next to config.json, which then
+    replaces it in one step, so a concurrent reader sees either the old
+    or the new file, never a half-written one.
     """
     CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with CONFIG_PATH.open("w", encoding="utf-8") as f:
-        json.dump(cfg, f, indent=2, sort_keys=False)
+    with _SAVE_LOCK:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=CONFIG_PATH.parent, prefix=CONFIG_PATH.name + ".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(cfg, f, indent=2, sort_keys=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, CONFIG_PATH)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    # Raw writes bypass FullConfig; drop any cached parse
+    invalidate_config_cache()
 
 
 def parse_full_config(raw: Dict[str, Any]) -> FullConfig:
@@ -170,7 +202,7 @@ def full_config_to_raw(cfg: FullConfig) -> Dict[str, Any]:
     for exe_path, app in cfg.apps.items():
         apps_raw[exe_path] = {
             "name": app.name,
-            "tags": app.tags,
+            "tags": list(app.tags),
             "last_seen": app.last_seen,
             "pinned": app.pinned,
         }
@@ -200,25 +232,66 @@ def full_config_to_raw(cfg: FullConfig) -> Dict[str, Any]:
     }
 
 
+def _config_stat_key() -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) of config.json, or None if it doesn't exist."""
+    try:
+        st = os.stat(CONFIG_PATH)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def invalidate_config_cache() -> None:
+    """Forget the cached config; the next load_config() re-reads disk."""
+    _CONFIG_CACHE.pop(str(CONFIG_PATH), None)
+
+
 def load_config() -> FullConfig:
     """
     Convenience: load_raw_config + parse_full_config.
-    On error, reset to default config on disk.
+    If config.json can't be read or parsed, the error is reported and the
+    last good copy (or, if there is none, the default config) is
+    returned; the file on disk is never overwritten here.
+
+    The raw JSON dict is cached until config.json changes on disk
+    (mtime/size), so repeated calls skip reading and decoding the file.
+    Every call returns a new FullConfig: changes a caller makes to it are
+    private until that caller passes it to save_config().
     """
+    key = _config_stat_key()
+    if key is not None:
+        cached = _CONFIG_CACHE.get(str(CONFIG_PATH))
+        if cached is not None and cached[0] == key:
+            return parse_full_config(cached[1])
+
     try:
         raw = load_raw_config()
-        return parse_full_config(raw)
+        cfg = parse_full_config(raw)
     except Exception as exc:
-        print(f"[config] Error loading config; resetting to default: {exc}")
-        return ensure_default_config()
+        cached = _CONFIG_CACHE.get(str(CONFIG_PATH))
+        if cached is not None:
+            print(f"[config] Error loading config; using last loaded copy: {exc}")
+            return parse_full_config(cached[1])
+        print(f"[config] Error loading config; using defaults (not saved): {exc}")
+        return parse_full_config(_default_raw_config())
+
+    if key is not None:
+        _CONFIG_CACHE[str(CONFIG_PATH)] = (key, raw)
+    return cfg
 
 
 def save_config(cfg: FullConfig) -> None:
     """
     Convenience: full_config_to_raw + save_raw_config.
+    The written dict (a snapshot, not cfg itself) becomes the cached
+    result of load_config().
     """
     raw = full_config_to_raw(cfg)
-    save_raw_config(raw)
+    with _SAVE_LOCK:
+        save_raw_config(raw)
+        key = _config_stat_key()
+        if key is not None:
+            _CONFIG_CACHE[str(CONFIG_PATH)] = (key, raw)
 
 
 def ensure_default_config() -> FullConfig:
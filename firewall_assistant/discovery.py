@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import sys
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 import datetime as _dt
+import time
 
 from .models import AppInfo, FullConfig
 
@@ -13,13 +17,155 @@ try:
     import psutil
 except ImportError:
     psutil = None  # type: ignore[assignment]
-    print("[discovery] WARNING: psutil is not installed. "
-          "discover_active_apps() will return an empty list.")
+    if not sys.platform.startswith("linux"):
+        print("[discovery] WARNING: psutil is not installed. "
+              "discover_active_apps() will return an empty list.")
+
+
+# (epoch second, formatted ISO string) for the last _now_iso() call
+_LAST_ISO: tuple[int, str] = (-1, "")
 
 
 def _now_iso() -> str:
-    """Return current UTC time as ISO string (seconds precision)."""
-    return _dt.datetime.utcnow().isoformat(timespec="seconds")
+    """
+    Return current UTC time as ISO string (seconds precision).
+    The formatted string is cached per wall-clock second, so bursts of
+    calls within the same second skip the datetime construction.
+    """
+    global _LAST_ISO
+    sec = int(time.time())
+    cached_sec, cached_iso = _LAST_ISO
+    if sec != cached_sec:
+        cached_iso = _dt.datetime.utcfromtimestamp(sec).isoformat()
+        _LAST_ISO = (sec, cached_iso)
+    return cached_iso
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolve_exe(raw_exe: str) -> str:
+    """
+    Resolve an exe path (as reported by psutil) to an absolute path.
+    Many processes share the same executable, so memoizing this saves a
+    realpath() per process per sweep; the LRU bound keeps the cache from
+    growing with every path seen over a long session.
+    """
+    return os.path.realpath(raw_exe)
+
+
+def _pids_with_inet_connections() -> set[int] | None:
+    """
+    Return the set of PIDs that own at least one inet socket, using a single
+    system-wide psutil.net_connections() call instead of one net_connections()
+    call per process.
+
+    Returns None if the system-wide query is not permitted (e.g. macOS
+    without root); callers then fall back to per-process queries.
+    """
+    try:
+        conns = psutil.net_connections(kind="inet")
+    except psutil.AccessDenied:
+        return None
+    return {c.pid for c in conns if c.pid}
+
+
+# /proc/net/tcp* state code for CLOSE (socket is gone, only the entry lingers)
+_TCP_STATE_CLOSE = "07"
+
+
+# /proc/<pid>/comm holds at most this many characters (TASK_COMM_LEN - 1)
+_COMM_MAX_LEN = 15
+
+
+def _active_socket_inodes_linux() -> set[str]:
+    """
+    Collect the inodes of all inet sockets from /proc/net/{tcp,tcp6,udp,udp6}.
+    Column 4 is the socket state and column 10 the inode.
+    """
+    inodes: set[str] = set()
+    for table in ("tcp", "tcp6", "udp", "udp6"):
+        try:
+            with open(f"/proc/net/{table}", "r") as f:
+                next(f, None)  # header line
+                for line in f:
+                    fields = line.split()
+                    if len(fields) < 10:
+                        continue
+                    if table.startswith("tcp") and fields[3] == _TCP_STATE_CLOSE:
+                        continue
+                    inode = fields[9]
+                    if inode != "0":
+                        inodes.add(inode)
+        except OSError:
+            # Table missing (e.g. IPv6 disabled)
+            continue
+    return inodes
+
+
+def _discover_active_apps_linux() -> List[AppInfo]:
+    """
+    Linux fast path for discover_active_apps(): read the socket tables from
+    /proc/net once, then match them against each process's /proc/<pid>/fd
+    links. Avoids psutil's per-process overhead entirely.
+    """
+    apps_by_exe: dict[str, AppInfo] = {}
+    apps_by_exe_get = apps_by_exe.get
+    now = _now_iso()
+
+    try:
+        active_inodes = _active_socket_inodes_linux()
+        if not active_inodes:
+            return []
+
+        for pid in os.listdir("/proc"):
+            if not pid.isdigit():
+                continue
+
+            connected = False
+            try:
+                with os.scandir(f"/proc/{pid}/fd") as fds:
+                    for fd in fds:
+                        try:
+                            link = os.readlink(fd.path)
+                        except OSError:
+                            continue
+                        if link.startswith("socket:[") and link[8:-1] in active_inodes:
+                            connected = True
+                            break
+                raw_exe = os.readlink(f"/proc/{pid}/exe") if connected else ""
+            except OSError:
+                # Permission denied, or the process exited meanwhile
+                continue
+
+            if not raw_exe:
+                continue
+
+            exe_path = _resolve_exe(raw_exe)
+
+            existing = apps_by_exe_get(exe_path)
+            if existing is None:
+                exe_name = Path(exe_path).name
+                try:
+                    with open(f"/proc/{pid}/comm", "r") as f:
+                        name = f.read().strip()
+                except OSError:
+                    name = ""
+                if len(name) >= _COMM_MAX_LEN and exe_name.startswith(name):
+                    # The kernel truncated comm; use the full file name (as psutil does)
+                    name = exe_name
+                apps_by_exe[exe_path] = AppInfo(
+                    exe_path=exe_path,
+                    name=name or exe_name,
+                    tags=[],
+                    last_seen=now,
+                    pinned=False,
+                )
+            else:
+                existing.last_seen = now
+
+    except Exception as exc:
+        print(f"[discovery] Top-level error during /proc discovery: {exc}")
+
+    return list(apps_by_exe.values())
 
 
 def discover_active_apps() -> List[AppInfo]:
@@ -28,40 +174,61 @@ def discover_active_apps() -> List[AppInfo]:
     (or had very recent activity).
 
     Implementation (Week 1):
-      - Use psutil to get inet connections per process.
+      - Use psutil to get all inet connections system-wide in one call
+        (falling back to per-process queries if that is not permitted).
       - For each process with at least one inet connection, create an AppInfo.
       - De-duplicate by exe_path.
+
+    On Linux, /proc is read directly instead (see _discover_active_apps_linux).
     """
+    if sys.platform.startswith("linux"):
+        return _discover_active_apps_linux()
+
     if psutil is None:
         return []
 
     apps_by_exe: dict[str, AppInfo] = {}
+    apps_by_exe_get = apps_by_exe.get
     now = _now_iso()
 
     try:
-        # Iterate over all processes, asking only for basic info
-        for proc in psutil.process_iter(["pid", "name", "exe"]):
-            try:
-                conns = proc.connections(kind="inet")  # may raise AccessDenied/NoSuchProcess
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                continue
-            except Exception as exc:
-                print(f"[discovery] Error getting connections for pid={proc.pid}: {exc}")
-                continue
+        connected_pids = _pids_with_inet_connections()
 
-            if not conns:
-                # Skip processes that don't use the network at the moment
+        # Iterate over all processes without prefetching any attributes;
+        # name/exe are only read for processes that pass the network check.
+        for proc in psutil.process_iter():
+            if connected_pids is not None:
+                if proc.pid not in connected_pids:
+                    # Skip processes that don't use the network at the moment
+                    continue
+            else:
+                try:
+                    # may raise AccessDenied/NoSuchProcess
+                    has_conn = bool(proc.net_connections(kind="inet"))
+                except (psutil.AccessDenied, psutil.NoSuchProcess):
+                    continue
+                except Exception as exc:
+                    print(f"[discovery] Error getting connections for pid={proc.pid}: {exc}")
+                    continue
+
+                if not has_conn:
+                    # Skip processes that don't use the network at the moment
+                    continue
+
+            try:
+                info = proc.as_dict(["name", "exe"])  # AccessDenied -> None values
+            except psutil.NoSuchProcess:
                 continue
 
-            raw_exe = proc.info.get("exe") or ""
+            raw_exe = info.get("exe") or ""
             if not raw_exe:
                 # Some system processes might not have a normal exe path
                 continue
 
-            exe_path = str(Path(raw_exe).resolve())
-            name = proc.info.get("name") or Path(exe_path).name
+            exe_path = _resolve_exe(raw_exe)
+            name = info.get("name") or Path(exe_path).name
 
-            existing = apps_by_exe.get(exe_path)
+            existing = apps_by_exe_get(exe_path)
             if existing is None:
                 apps_by_exe[exe_path] = AppInfo(
                     exe_path=exe_path,
@@ -80,25 +247,29 @@ def discover_active_apps() -> List[AppInfo]:
     return list(apps_by_exe.values())
 
 
-def merge_discovered_apps_into_config(cfg: FullConfig) -> None:
+def merge_discovered_apps_into_config(
+    cfg: FullConfig,
+    discovered: Optional[List[AppInfo]] = None,
+) -> None:
     """
-    Take FullConfig, run discover_active_apps(), and:
+    Take FullConfig, run discover_active_apps() (unless the result of an
+    earlier run is passed as 'discovered'), and:
       - Add any new exe_path to cfg.apps with basic info.
       - Update last_seen for known apps.
 
     Does NOT save to disk; caller must call save_config().
     """
-    discovered = discover_active_apps()
+    if discovered is None:
+        discovered = discover_active_apps()
     if not discovered:
         return
 
+    apps_setdefault = cfg.apps.setdefault
     for app in discovered:
-        existing = cfg.apps.get(app.exe_path)
+        # New app discovered: added as-is (single hash of exe_path)
+        existing = apps_setdefault(app.exe_path, app)
 
-        if existing is None:
-            # New app discovered: add as-is
-            cfg.apps[app.exe_path] = app
-        else:
+        if existing is not app:
             # Known app: update last_seen; keep existing custom name/tags/pinned
             existing.last_seen = app.last_seen or existing.last_seen
             # If the existing name is empty for some reason, fill it
@@ -7,9 +7,10 @@ import ctypes
 import subprocess
 from pathlib import Path
 from typing import List, Literal, Optional
-import datetime as _dt
+import time
 
 from .activity_log import log_event
+from .models import AppRule, FullConfig
 
 Direction = Literal["in", "out", "both"]
 
@@ -190,6 +191,10 @@ def allow_app(path: str) -> None:
     """
     Allow an application's network access again by removing all FWAssist rules
     associated with that executable (by name pattern).
+
+    Rule names only carry the exe's file name, so the delete is also
+    filtered on program=<full path>: another app with the same file name
+    (e.g. a second python.exe) keeps its block rules.
     """
     exe_path = str(Path(path).resolve())
     print(f"[INFO] Allowing app '{exe_path}' (removing FWAssist_* rules)")
@@ -200,7 +205,7 @@ def allow_app(path: str) -> None:
     actually_removed: list[str] = []
     for name in rule_names:
         try:
-            _run_netsh(["delete", "rule", f"name={name}"])
+            _run_netsh(["delete", "rule", f"name={name}", f"program={exe_path}"])
             print(f"[OK] Deleted rule '{name}' (if it existed).")
             removed_any = True
             actually_removed.append(name)
@@ -268,15 +273,91 @@ def status_app(path: str) -> None:
 # Profile sync – aware of temporary_until
 # ---------------------------------------------------------------------------
 
+def _apply_rule(
+    profile_name: str,
+    exe_path: str,
+    rule: AppRule,
+    now_epoch: int,
+    replace: bool = False,
+) -> bool:
+    """
+    Create/remove the FWAssist_* rules for one app rule of a profile,
+    considering temporary_until on block rules. With replace=True, any
+    existing block rules for the app are removed first (incremental sync;
+    a full sync has already cleared everything).
+
+    Returns True if rule.temporary_until was cleared (expired / invalid),
+    i.e. the config needs saving.
+    """
+    exe_path_resolved = str(Path(exe_path).resolve())
+    dir_value: Direction = rule.direction  # config parsing normalizes this
+
+    # Determine effective action, considering temporary_until on block rules
+    effective_action = rule.action
+    temp_active = False
+    cfg_modified = False
+
+    if rule.temporary_until and rule.action == "block":
+        until_epoch = rule.temporary_until_epoch
+        if until_epoch is not None and now_epoch < until_epoch:
+            # Temporarily allow: skip creating block rule
+            effective_action = "allow"
+            temp_active = True
+        else:
+            # Temporary has expired (or the timestamp is invalid); clear it
+            rule.temporary_until = None
+            cfg_modified = True
+
+    if effective_action == "block":
+        if replace:
+            # Drop the app's current rules so the block isn't added twice
+            allow_app(exe_path_resolved)
+        block_app(exe_path_resolved, direction=dir_value)
+        log_event(
+            "PROFILE_RULE_APPLIED",
+            f"Profile '{profile_name}' blocking {exe_path_resolved} ({dir_value})",
+            {
+                "profile": profile_name,
+                "exe_path": exe_path_resolved,
+                "action": "block",
+                "direction": dir_value,
+                "temporary_until": rule.temporary_until,
+            },
+        )
+    elif effective_action == "allow":
+        # This is either an explicit allow rule, or a temporary allow
+        allow_app(exe_path_resolved)
+        event_type = "PROFILE_RULE_APPLIED"
+        message = f"Profile '{profile_name}' allowing {exe_path_resolved}"
+        extra: dict = {
+            "profile": profile_name,
+            "exe_path": exe_path_resolved,
+            "action": "allow",
+            "base_action": rule.action,
+            "temporary_until": rule.temporary_until,
+        }
+        if temp_active:
+            event_type = "PROFILE_RULE_TEMP_ALLOW_IN_EFFECT"
+            message = (
+                f"Profile '{profile_name}' TEMPORARILY ALLOWING "
+                f"{exe_path_resolved} until {rule.temporary_until}"
+            )
+        log_event(event_type, message, extra)
+    # (any other action should not happen: Action is Literal["allow","block"])
+
+    return cfg_modified
+
+
 def sync_profile_to_windows_firewall(
     profile_name: str,
     cfg_path: Optional[str] = None,  # cfg_path unused; config module has global path
-) -> None:
+    cfg: Optional[FullConfig] = None,
+) -> List[str]:
     """
     Enforce the given profile in Windows Firewall.
 
     Steps:
-      1) Load config.json
+      1) Load config.json (unless 'cfg' is given)
       2) Clear all existing FWAssist_* rules
       3) For the selected profile:
            - For each app rule:
@@ -285,10 +366,17 @@ def sync_profile_to_windows_firewall(
                * if action == "allow": remove any FWAssist_* rules for that app
       4) If any temporary_until timestamps have expired or are invalid,
          clear them in config.
+
+    Returns the exe paths whose temporary_until was cleared in step 4.
+    If 'cfg' is given (e.g. a snapshot handed to a worker thread), config.json
+    is neither read nor written: the cleared rules are only changed in
+    'cfg', and saving them is up to the caller.
     """
     from .config import load_config, save_config
 
-    cfg = load_config()
+    own_cfg = cfg is None
+    if cfg is None:
+        cfg = load_config()
 
     if profile_name not in cfg.profiles:
         raise ValueError(f"Profile '{profile_name}' not found in config")
@@ -306,71 +394,15 @@ def sync_profile_to_windows_firewall(
     _clear_all_fwassist_rules()
 
     # 2) Apply rules for this profile
-    now = _dt.datetime.utcnow()
-    cfg_modified = False
+    now_epoch = int(time.time())
+    expired: List[str] = []
 
     for exe_path, rule in profile.app_rules.items():
-        exe_path_resolved = str(Path(exe_path).resolve())
-        dir_value: Direction = rule.direction  # config parsing normalizes this
-
-        # Determine effective action, considering temporary_until on block rules
-        effective_action = rule.action
-        temp_active = False
-
-        if rule.temporary_until and rule.action == "block":
-            try:
-                expiry = _dt.datetime.fromisoformat(rule.temporary_until)
-                if now < expiry:
-                    # Temporarily allow: skip creating block rule
-                    effective_action = "allow"
-                    temp_active = True
-                else:
-                    # Temporary has expired; clear it
-                    rule.temporary_until = None
-                    cfg_modified = True
-            except ValueError:
-                # Invalid timestamp; clear it to avoid confusion
-                rule.temporary_until = None
-                cfg_modified = True
-
-        if effective_action == "block":
-            block_app(exe_path_resolved, direction=dir_value)
-            log_event(
-                "PROFILE_RULE_APPLIED",
-                f"Profile '{profile_name}' blocking {exe_path_resolved} ({dir_value})",
-                {
-                    "profile": profile_name,
-                    "exe_path": exe_path_resolved,
-                    "action": "block",
-                    "direction": dir_value,
-                    "temporary_until": rule.temporary_until,
-                },
-            )
-        elif effective_action == "allow":
-            # This is either an explicit allow rule, or a temporary allow
-            allow_app(exe_path_resolved)
-            event_type = "PROFILE_RULE_APPLIED"
-            message = f"Profile '{profile_name}' allowing {exe_path_resolved}"
-            extra: dict = {
-                "profile": profile_name,
-                "exe_path": exe_path_resolved,
-                "action": "allow",
-                "base_action": rule.action,
-                "temporary_until": rule.temporary_until,
-            }
-            if temp_active:
-                event_type = "PROFILE_RULE_TEMP_ALLOW_IN_EFFECT"
-                message = (
-                    f"Profile '{profile_name}' TEMPORARILY ALLOWING "
-                    f"{exe_path_resolved} until {rule.temporary_until}"
-                )
-            log_event(event_type, message, extra)
-        else:
-            # Should not happen (Action is Literal["allow","block"])
-            continue
+        if _apply_rule(profile_name, exe_path, rule, now_epoch):
+            expired.append(exe_path)
 
     # Save config if we modified any temporary_until (expired / invalid)
-    if cfg_modified:
+    if expired and own_cfg:
         save_config(cfg)
 
     print(f"[INFO] Profile '{profile_name}' sync complete.")
@@ -379,6 +411,66 @@ def sync_profile_to_windows_firewall(
         f"Finished syncing profile '{profile_name}'",
         {"profile": profile_name},
     )
+    return expired
+
+
+def sync_app_rules_to_windows_firewall(
+    profile_name: str,
+    exe_paths: List[str],
+    cfg: Optional[FullConfig] = None,
+) -> List[str]:
+    """
+    Incremental form of sync_profile_to_windows_firewall(): re-apply only
+    the given apps' rules from the profile, leaving every other FWAssist_*
+    rule in place. Use after changing a few rules in the active profile;
+    switching profiles still needs the full sync.
+
+    Apps without a rule in the profile get their FWAssist_* rules removed.
+    Nothing is changed if profile_name is no longer the active profile
+    (e.g. a late call after a profile switch).
+
+    'cfg' and the return value work as in sync_profile_to_windows_firewall().
+    """
+    from .config import load_config, save_config
+
+    own_cfg = cfg is None
+    if cfg is None:
+        cfg = load_config()
+
+    if profile_name not in cfg.profiles:
+        raise ValueError(f"Profile '{profile_name}' not found in config")
+
+    if profile_name != cfg.active_profile:
+        log_event(
+            "PROFILE_APP_RULES_SYNC_SKIPPED",
+            f"Not syncing app rules of profile '{profile_name}': "
+            f"active profile is '{cfg.active_profile}'",
+            {"profile": profile_name, "active_profile": cfg.active_profile, "apps": list(exe_paths)},
+        )
+        return []
+
+    profile = cfg.profiles[profile_name]
+
+    now_epoch = int(time.time())
+    expired: List[str] = []
+
+    for exe_path in exe_paths:
+        rule = profile.app_rules.get(exe_path)
+        if rule is None:
+            allow_app(exe_path)
+        elif _apply_rule(profile_name, exe_path, rule, now_epoch, replace=True):
+            expired.append(exe_path)
+
+    # Save config if we modified any temporary_until (expired / invalid)
+    if expired and own_cfg:
+        save_config(cfg)
+
+    log_event(
+        "PROFILE_APP_RULES_SYNCED",
+        f"Synced {len(exe_paths)} app rule(s) of profile '{profile_name}'",
+        {"profile": profile_name, "apps": list(exe_paths)},
+    )
+    return expired
 
 
 # ---------------------------------------------------------------------------
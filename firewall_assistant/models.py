@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import calendar
+import datetime as _dt
 from dataclasses import dataclass, field
-from typing import Dict, List, Literal, Optional
+from typing import Dict, List, Literal, Optional, Tuple
 
 Action = Literal["allow", "block"]
 Direction = Literal["in", "out", "both"]
@@ -31,6 +33,34 @@ class AppRule:
     action: Action          # "allow" or "block"
     direction: Direction = "out"
     temporary_until: Optional[str] = None  # ISO timestamp or None (for future use)
+    # (temporary_until, parsed epoch) – see temporary_until_epoch
+    _until_epoch_cache: Optional[Tuple[str, Optional[int]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def temporary_until_epoch(self) -> Optional[int]:
+        """
+        temporary_until as UTC unix seconds, or None if unset/invalid.
+        Parsed once per distinct temporary_until value, so hot loops can
+        compare against int(time.time()) instead of parsing ISO strings.
+        """
+        value = self.temporary_until
+        if not value:
+            return None
+        cache = self._until_epoch_cache
+        if cache is None or cache[0] != value:
+            cache = (value, _iso_to_epoch(value))
+            self._until_epoch_cache = cache
+        return cache[1]
+
+
+def _iso_to_epoch(value: str) -> Optional[int]:
+    """UTC ISO timestamp (naive = UTC) -> unix seconds; None if unparseable."""
+    try:
+        return calendar.timegm(_dt.datetime.fromisoformat(value).utctimetuple())
+    except ValueError:
+        return None
 
 
 @dataclass
@@ -2,16 +2,44 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-from typing import Any, Dict
+import functools
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 import datetime as _dt
 
-from .models import FullConfig, ProfileConfig, Action, AppRule
+from .models import FullConfig, ProfileConfig, Action, AppRule, Direction
 from .config import load_config, save_config
-from .firewall_win import sync_profile_to_windows_firewall
+from .firewall_win import sync_app_rules_to_windows_firewall, sync_profile_to_windows_firewall
 from .activity_log import log_event
 
 
+@functools.lru_cache(maxsize=4096)
+def _realpath(exe_path: str) -> str:
+    """os.path.realpath() for absolute paths, memoized."""
+    return os.path.realpath(exe_path)
+
+
+def _canon(exe_path: str, cfg: FullConfig, profile: ProfileConfig) -> str:
+    """
+    Canonical form of an exe path, used as the key in app_rules.
+
+    Discovery stores realpath()s, so an absolute path without '..' whose
+    normpath() is already a known key (an app in cfg.apps or a rule in
+    profile) is used as is, without touching the filesystem. Anything else
+    goes through realpath(), which resolves symlinks (and, on Windows, the
+    on-disk letter case); that is memoized for absolute paths only, since
+    a relative path's result depends on the current directory.
+    """
+    if not os.path.isabs(exe_path):
+        return os.path.realpath(exe_path)
+    if ".." not in exe_path:
+        norm = os.path.normpath(exe_path)
+        if norm in cfg.apps or norm in profile.app_rules:
+            return norm
+    return _realpath(exe_path)
+
+
 def get_active_profile(cfg: FullConfig) -> ProfileConfig:
     """
     Return the currently active ProfileConfig from FullConfig.
@@ -54,7 +82,9 @@ def apply_profile(profile_name: str) -> None:
     High-level: load config, set active_profile, save config,
     and call sync_profile_to_windows_firewall(profile_name).
 
-    UI or CLI should call this when the user selects a profile.
+    CLI should call this when the user selects a profile. The UI, which
+    keeps its own config, uses set_active_profile() and then syncs the
+    firewall in the background.
     """
     cfg = load_config()
 
@@ -74,6 +104,27 @@ def apply_profile(profile_name: str) -> None:
     sync_profile_to_windows_firewall(profile_name)
 
 
+def _set_rule_action(profile: ProfileConfig, exe_path: str, action: Action) -> str:
+    """
+    Set profile.app_rules[exe_path] (already canonical) to action, creating
+    an outbound rule if needed. Returns "created" or "updated".
+    """
+    rule = profile.app_rules.get(exe_path)
+    if rule is None:
+        profile.app_rules[exe_path] = AppRule(
+            app_exe_path=exe_path,
+            action=action,
+            direction="out",
+            temporary_until=None,
+        )
+        return "created"
+
+    rule.action = action
+    # When user explicitly sets rule, clear any previous temporary allowance
+    rule.temporary_until = None
+    return "updated"
+
+
 def set_app_action_in_profile(
     cfg: FullConfig,
     profile_name: str,
@@ -90,24 +141,9 @@ def set_app_action_in_profile(
     if profile_name not in cfg.profiles:
         raise ValueError(f"Profile '{profile_name}' not found")
 
-    exe_path_resolved = str(Path(exe_path).resolve())
     profile = cfg.profiles[profile_name]
-
-    rule = profile.app_rules.get(exe_path_resolved)
-    if rule is None:
-        rule = AppRule(
-            app_exe_path=exe_path_resolved,
-            action=action,
-            direction="out",
-            temporary_until=None,
-        )
-        profile.app_rules[exe_path_resolved] = rule
-        change_type = "created"
-    else:
-        rule.action = action
-        # When user explicitly sets rule, clear any previous temporary allowance
-        rule.temporary_until = None
-        change_type = "updated"
+    exe_path_resolved = _canon(exe_path, cfg, profile)
+    change_type = _set_rule_action(profile, exe_path_resolved, action)
 
     log_event(
         "PROFILE_APP_RULE_CHANGED",
@@ -121,6 +157,61 @@ def set_app_action_in_profile(
     )
 
 
+def set_app_actions_in_profile(
+    cfg: FullConfig,
+    profile_name: str,
+    changes: Iterable[Tuple[str, Action]],
+) -> List[str]:
+    """
+    Batch form of set_app_action_in_profile: apply (exe_path, action) pairs
+    to one profile and write a single log entry for all of them.
+    Pairs that would not change anything (rule already has that action and
+    no temporary allowance) are skipped. A pair that fails is logged and
+    skipped too; the others are still applied. Returns the canonical exe
+    paths that were changed; if it is empty, there is nothing to save or
+    sync.
+
+    Caller should then save_config(cfg) and (optionally) apply_profile(cfg.active_profile)
+    once to sync changes to Windows Firewall.
+    """
+    if profile_name not in cfg.profiles:
+        raise ValueError(f"Profile '{profile_name}' not found")
+
+    profile = cfg.profiles[profile_name]
+    changed: List[Dict[str, str]] = []
+    failed: List[Dict[str, str]] = []
+    app_rules = profile.app_rules
+    for exe_path, action in changes:
+        try:
+            exe_path_resolved = _canon(exe_path, cfg, profile)
+            rule = app_rules.get(exe_path_resolved)
+            if rule is not None and rule.action == action and rule.temporary_until is None:
+                continue
+            change_type = _set_rule_action(profile, exe_path_resolved, action)
+        except Exception as exc:
+            failed.append({"exe_path": exe_path, "action": action, "error": str(exc)})
+            continue
+        changed.append({
+            "exe_path": exe_path_resolved,
+            "action": action,
+            "change_type": change_type,
+        })
+
+    if changed:
+        log_event(
+            "PROFILE_APP_RULE_CHANGED",
+            f"Rules changed for {len(changed)} app(s) in profile '{profile_name}'",
+            {"profile": profile_name, "changes": changed},
+        )
+    if failed:
+        log_event(
+            "ERROR",
+            f"Failed to change rules for {len(failed)} app(s) in profile '{profile_name}'",
+            {"profile": profile_name, "failures": failed},
+        )
+    return [c["exe_path"] for c in changed]
+
+
 # ---------------------------------------------------------------------------
 # Temporary allow helper ("Why is this app not working?")
 # ---------------------------------------------------------------------------
@@ -128,20 +219,26 @@ def set_app_action_in_profile(
 def set_temporary_allow_in_active_profile(
     exe_path: str,
     minutes: int = 60,
-) -> None:
+    cfg: Optional[FullConfig] = None,
+) -> str:
     """
     Mark a BLOCK rule for this app in the ACTIVE profile as temporarily allowed
-    for 'minutes' minutes.
+    for 'minutes' minutes. Returns the canonical exe path (the rule's key).
 
     Semantics:
       - The underlying rule.action remains "block".
       - temporary_until is set to now + minutes.
       - sync_profile_to_windows_firewall() treats this as ALLOW until expiry.
       - After expiry (next sync), it behaves as a normal block again.
+
+    If 'cfg' is given (e.g. the UI's own config), only that object is
+    mutated; saving and syncing the firewall are left to the caller.
     """
-    cfg = load_config()
+    own_cfg = cfg is None
+    if cfg is None:
+        cfg = load_config()
     profile = get_active_profile(cfg)
-    exe_path_resolved = str(Path(exe_path).resolve())
+    exe_path_resolved = _canon(exe_path, cfg, profile)
 
     rule = profile.app_rules.get(exe_path_resolved)
     if rule is None or rule.action != "block":
@@ -153,7 +250,8 @@ def set_temporary_allow_in_active_profile(
     until_dt = _dt.datetime.utcnow() + _dt.timedelta(minutes=minutes)
     until_str = until_dt.isoformat(timespec="seconds")
     rule.temporary_until = until_str
-    save_config(cfg)
+    if own_cfg:
+        save_config(cfg)
 
     log_event(
         "APP_TEMP_ALLOW_SET",
@@ -166,14 +264,71 @@ def set_temporary_allow_in_active_profile(
         },
     )
 
-    # Re-apply profile so firewall immediately unblocks this app.
-    sync_profile_to_windows_firewall(profile.name)
+    # Re-apply the app's rule so firewall immediately unblocks this app.
+    if own_cfg:
+        sync_app_rules_to_windows_firewall(profile.name, [exe_path_resolved])
+    return exe_path_resolved
 
 
 # ---------------------------------------------------------------------------
 # "Why is this app not working?" backend helper
 # ---------------------------------------------------------------------------
 
+_REASON_DEFAULT = (
+    "No explicit rule in profile '{profile}'. Using default_action='{action}'."
+)
+_REASON_EXPLICIT = "Explicit rule in profile '{profile}': {action} ({direction})"
+_REASON_TEMP_ALLOW = (
+    "This app would normally be BLOCKED by profile '{profile}', "
+    "but it is TEMPORARILY ALLOWED until {until}."
+)
+
+
+def _explain_rule(
+    profile: ProfileConfig,
+    rule: Optional[AppRule],
+) -> Tuple[Action, Direction, Optional[str], str]:
+    """
+    Return (effective action, direction, temporary_until, reason) for a rule
+    (or None) in profile. The common cases - no rule, or a rule without an
+    active temporary allow - return early without touching datetime.
+    """
+    if rule is None:
+        # No explicit rule: fall back to default_action
+        return (
+            profile.default_action,
+            "out",
+            None,
+            _REASON_DEFAULT.format(
+                profile=profile.display_name, action=profile.default_action
+            ),
+        )
+
+    temporary_until = rule.temporary_until
+    explicit_reason = _REASON_EXPLICIT.format(
+        profile=profile.display_name,
+        action=rule.action.upper(),
+        direction=rule.direction,
+    )
+    if not temporary_until or rule.action != "block":
+        return rule.action, rule.direction, temporary_until, explicit_reason
+
+    # A BLOCK rule with temporary_until still in the future is effectively ALLOW.
+    # (Malformed timestamps have no epoch and are treated as a normal block.)
+    until_epoch = rule.temporary_until_epoch
+    temp_active = until_epoch is not None and int(time.time()) < until_epoch
+
+    if not temp_active:
+        return rule.action, rule.direction, temporary_until, explicit_reason
+
+    return (
+        "allow",
+        rule.direction,
+        temporary_until,
+        _REASON_TEMP_ALLOW.format(profile=profile.display_name, until=temporary_until),
+    )
+
+
 def explain_app_in_active_profile(exe_path: str) -> Dict[str, Any]:
     """
     Explain how the currently active profile treats the given exe_path.
@@ -189,64 +344,20 @@ def explain_app_in_active_profile(exe_path: str) -> Dict[str, Any]:
     """
     cfg = load_config()
     profile = get_active_profile(cfg)
-    exe_path_resolved = str(Path(exe_path).resolve())
-    now = _dt.datetime.utcnow()
-
-    explicit_rule = profile.app_rules.get(exe_path_resolved)
-
-    if explicit_rule:
-        effective_action: Action = explicit_rule.action
-        direction = explicit_rule.direction
-        temporary_until = explicit_rule.temporary_until
-        temp_active = False
-
-        # If there's a temporary_until on a BLOCK rule, and it's still in the future,
-        # treat this as effectively ALLOW for now.
-        if temporary_until and explicit_rule.action == "block":
-            try:
-                expiry = _dt.datetime.fromisoformat(temporary_until)
-                if now < expiry:
-                    effective_action = "allow"
-                    temp_active = True
-            except ValueError:
-                # Ignore malformed timestamps; treat as normal block/allow
-                pass
-
-        if temp_active:
-            reason = (
-                f"This app would normally be BLOCKED by profile "
-                f"'{profile.display_name}', but it is TEMPORARILY ALLOWED "
-                f"until {temporary_until}."
-            )
-        else:
-            reason = (
-                f"Explicit rule in profile '{profile.display_name}': "
-                f"{explicit_rule.action.upper()} ({explicit_rule.direction})"
-            )
-
-        explanation: Dict[str, Any] = {
-            "exe_path": exe_path_resolved,
-            "profile": profile.name,
-            "profile_display_name": profile.display_name,
-            "action": effective_action,
-            "direction": direction,
-            "temporary_until": temporary_until,
-            "reason": reason,
-        }
-    else:
-        # No explicit rule: fall back to default_action
-        explanation = {
-            "exe_path": exe_path_resolved,
-            "profile": profile.name,
-            "profile_display_name": profile.display_name,
-            "action": profile.default_action,
-            "direction": "out",
-            "temporary_until": None,
-            "reason": (
-                f"No explicit rule in profile '{profile.display_name}'. "
-                f"Using default_action='{profile.default_action}'."
-            ),
-        }
+    exe_path_resolved = _canon(exe_path, cfg, profile)
+
+    action, direction, temporary_until, reason = _explain_rule(
+        profile, profile.app_rules.get(exe_path_resolved)
+    )
+    explanation: Dict[str, Any] = {
+        "exe_path": exe_path_resolved,
+        "profile": profile.name,
+        "profile_display_name": profile.display_name,
+        "action": action,
+        "direction": direction,
+        "temporary_until": temporary_until,
+        "reason": reason,
+    }
 
     # Log that someone asked for an explanation
     log_event(
@@ -273,7 +384,7 @@ def _list_rules_for_profile(profile_name: str) -> None:
         return
 
     profile = cfg.profiles[profile_name]
-    now = _dt.datetime.utcnow()
+    now_epoch = int(time.time())
 
     print(f"Profile: {profile.display_name} ({profile.name})")
     print(f"default_action = {profile.default_action}")
@@ -286,14 +397,11 @@ def _list_rules_for_profile(profile_name: str) -> None:
     for exe_path, rule in profile.app_rules.items():
         eff_action: Action = rule.action
         temp_note = ""
-        if rule.temporary_until and rule.action == "block":
-            try:
-                expiry = _dt.datetime.fromisoformat(rule.temporary_until)
-                if now < expiry:
-                    eff_action = "allow"
-                    temp_note = f" (TEMP ALLOW until {rule.temporary_until})"
-            except ValueError:
-                pass
+        if rule.action == "block":
+            until_epoch = rule.temporary_until_epoch
+            if until_epoch is not None and now_epoch < until_epoch:
+                eff_action = "allow"
+                temp_note = f" (TEMP ALLOW until {rule.temporary_until})"
 
         print(f"  {exe_path}")
         print(f"    base_action   = {rule.action}")
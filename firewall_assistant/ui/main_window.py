@@ -2,23 +2,74 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+import logging
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
 import datetime as _dt
 
 from ..config import load_config, save_config
 from ..profiles import (
-    apply_profile,
-    set_app_action_in_profile,
+    set_active_profile,
+    set_app_actions_in_profile,
     get_active_profile,
     explain_app_in_active_profile,
     set_temporary_allow_in_active_profile,
 )
-from ..discovery import merge_discovered_apps_into_config
-from ..activity_log import get_recent_events, log_event
-from ..models import FullConfig, AppInfo
-from ..firewall_win import is_admin  # for admin status indicator
+from ..activity_log import get_log_version, get_recent_events, log_event
+from ..models import Action, FullConfig, AppInfo, ProfileConfig
+from ..firewall_win import (
+    is_admin,
+    sync_app_rules_to_windows_firewall,
+    sync_profile_to_windows_firewall,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Apps are added to the Treeview in pages of this many rows
+ROWS_PAGE_SIZE = 100
+
+# Most recent activity log lines kept in the logs listbox
+LOG_LINES_SHOWN = 200
+
+# How often the log view checks the activity log for new events (ms)
+LOG_POLL_MS = 1500
+
+# Above this many apps, the sort for the table runs on a worker thread
+SORT_OFFTHREAD_THRESHOLD = 500
+
+# Status column text per row status; the keys double as apps_tree tags
+STATUS_DISPLAY = {"allow": "ALLOW", "block": "BLOCK", "temp": "ALLOW (TEMP)"}
+_STATUS_TAG = {text: tag for tag, text in STATUS_DISPLAY.items()}
+
+
+@functools.lru_cache(maxsize=4096)
+def _row_display_values(name: str, exe_path: str, status: str) -> Tuple[str, str, str]:
+    """
+    Values tuple for one apps_tree row. Memoized so unchanged rows get the
+    same tuple object on every refresh (cheap identity check in _apply_rows).
+    """
+    return (name, exe_path, status)
+
+
+def _discover_apps() -> List[AppInfo]:
+    """Worker thread: scan processes for apps with network connections."""
+    # Imported on first use (and off the Tk thread): discovery pulls in
+    # psutil, which the window doesn't need until Refresh Apps is clicked.
+    from ..discovery import discover_active_apps
+
+    return discover_active_apps()
+
+
+def _sort_apps(apps: List[AppInfo]) -> Tuple[AppInfo, ...]:
+    """Apps in table order: by (name, exe_path), case-insensitive."""
+    return tuple(sorted(apps, key=lambda a: (a.name.lower(), a.exe_path.lower())))
 
 
 class MainWindow(tk.Tk):
@@ -28,23 +79,109 @@ class MainWindow(tk.Tk):
         self.title("Firewall Assistant")
         self.geometry("900x600")
 
-        # Load config and determine active profile
-        self.cfg: FullConfig = load_config()
+        # Config, active profile and admin status are loaded in _bootstrap,
+        # after the window has been drawn; these are placeholders until then.
+        self.cfg: FullConfig = FullConfig()
         self.current_profile_name: str = self.cfg.active_profile
+        self._active_profile: ProfileConfig  # set in _bootstrap
+        self.is_admin: bool = False
 
         # Track last time "Refresh Apps" was called (for status bar)
         self.last_apps_refresh: Optional[str] = None
 
+        # Profile radiobuttons, reused across _populate_profiles calls.
+        # profile_var is the window's only Tk variable: per-row data in
+        # apps_tree is plain strings set via item()/set(), never a
+        # StringVar per row/cell (each would add a Tcl trace per update).
+        self.profile_var = tk.StringVar(value=self.current_profile_name)
+        self._profile_buttons: Dict[str, ttk.Radiobutton] = {}
+
+        # Sorted view of cfg.apps (see _get_sorted_apps)
+        self._sorted_apps_cache: Optional[Tuple[AppInfo, ...]] = None
+        # Bumped whenever the cache is dropped; off-thread sorts started
+        # under an older epoch are discarded (see _sort_apps_async)
+        self._sort_epoch: int = 0
+        self._sort_running_epoch: int = -1
+
+        # exe_path -> status column text under the active profile, for apps
+        # with an explicit rule (see _get_status_map)
+        self._status_by_exe: Optional[Dict[str, str]] = None
+        # Epoch second at which the earliest temporary allow in the map expires
+        self._status_map_expires: Optional[int] = None
+
+        # Number of sorted apps materialized as tree rows (grows on scroll)
+        self._rows_limit: int = ROWS_PAGE_SIZE
+        self._page_load_pending: bool = False
+
+        # Rows currently shown in apps_tree (see _apply_rows)
+        self._row_by_exe: Dict[str, str] = {}   # exe_path -> tree item id
+        self._exe_by_iid: Dict[str, str] = {}   # tree item id -> exe_path
+        self._row_values: Dict[str, Tuple[str, str, str]] = {}
+        self._row_order: List[str] = []
+        self._next_row_id: int = 0
+
+        # Firewall syncs (netsh) run here, one at a time, off the Tk thread
+        self._fw_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="firewall")
+        self._fw_jobs: int = 0
+        # Other background work (app discovery, large sorts); see _submit
+        self._bg_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="background")
+
+        # Redraws deferred by batch_ui ("apps", "logs", "chrome")
+        self._batch_depth: int = 0
+        self._dirty: Set[str] = set()
+        self._dirty_flush_scheduled: bool = False
+        # Texts last written to active_profile_label / status_bar
+        self._chrome_text: Tuple[str, str] = ("", "")
+
+        # Throttled log view reloads (see _request_logs_refresh)
+        self._logs_refresh_scheduled: bool = False
+        # Log file version last shown in logs_list (see get_log_version)
+        self._logs_version: Optional[Tuple[int, int]] = None
+        # Timestamp of the newest event shown, and how many shown events
+        # carry exactly that timestamp (see refresh_logs)
+        self._logs_last_ts: Optional[str] = None
+        self._logs_last_ts_count: int = 0
+
+        # Debounced config writes: after() id of the pending save, if any
+        # (see _schedule_save)
+        self._save_after_id: Optional[str] = None
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Top-level layout frames; the rest is filled in once Tk is idle
+        self._build_layout()
+        self._show_loading()
+        self.after_idle(self._bootstrap)
+
+    def _show_loading(self) -> None:
+        """Placeholder UI shown until _bootstrap has loaded config."""
+        self.refresh_apps_button.state(["disabled"])
+        self.apps_tree.insert("", tk.END, iid="loading", values=("Loading…", "", ""))
+        self.status_bar.config(text="Loading…")
+
+    def _bootstrap(self) -> None:
+        """
+        Startup work that needs I/O (config file, admin check, activity
+        log), run after the window skeleton has been drawn so the user
+        doesn't stare at a blank window meanwhile.
+        """
+        self.update_idletasks()
+
+        # Load config and determine active profile
+        cfg = load_config()
+        self.current_profile_name = cfg.active_profile
+        self._set_cfg(cfg)
+
         # Check admin status once
-        self.is_admin: bool = is_admin()
+        self.is_admin = is_admin()
+
+        self.apps_tree.delete("loading")
+        self.refresh_apps_button.state(["!disabled"])
 
-        # Top-level layout frames
-        self._build_layout()
         self._populate_profiles()
         self.refresh_apps_table()
         self.refresh_logs()
         self._update_admin_status_label()
-        self._update_status_bar()
+        self.after(LOG_POLL_MS, self._poll_logs)
 
     # ------------------------------------------------------------------
     # Layout / UI construction
@@ -103,6 +240,9 @@ class MainWindow(tk.Tk):
         """Create the apps Treeview and its buttons."""
         # Treeview with scrollbars
         columns = ("name", "exe_path", "status")
+        # Rows hold plain string values (see _apply_rows). Any future
+        # in-place cell editing should write back with
+        # apps_tree.set(iid, column, value), not bind a StringVar per cell.
         self.apps_tree = ttk.Treeview(
             self.apps_frame,
             columns=columns,
@@ -116,13 +256,19 @@ class MainWindow(tk.Tk):
         self.apps_tree.column("name", width=160, anchor="w")
         self.apps_tree.column("exe_path", width=420, anchor="w")
         self.apps_tree.column("status", width=180, anchor="center")
+        # Row colour by status (tags set in _apply_rows)
+        self.apps_tree.tag_configure("allow", foreground="green")
+        self.apps_tree.tag_configure("block", foreground="red")
+        self.apps_tree.tag_configure("temp", foreground="dark orange")
 
-        vsb = ttk.Scrollbar(self.apps_frame, orient="vertical", command=self.apps_tree.yview)
+        self._apps_vsb = ttk.Scrollbar(self.apps_frame, orient="vertical", command=self.apps_tree.yview)
         hsb = ttk.Scrollbar(self.apps_frame, orient="horizontal", command=self.apps_tree.xview)
-        self.apps_tree.configure(yscroll=vsb.set, xscroll=hsb.set)
+        # Rows are materialized page by page as the view nears the end
+        # (see _on_apps_yscroll), so the tree never holds all apps up front.
+        self.apps_tree.configure(yscroll=self._on_apps_yscroll, xscroll=hsb.set)
 
         self.apps_tree.grid(row=0, column=0, sticky="nsew")
-        vsb.grid(row=0, column=1, sticky="ns")
+        self._apps_vsb.grid(row=0, column=1, sticky="ns")
         hsb.grid(row=1, column=0, sticky="ew")
 
         # Update buttons when selection changes
@@ -200,38 +346,33 @@ class MainWindow(tk.Tk):
     # ------------------------------------------------------------------
 
     def _populate_profiles(self) -> None:
-        """Create profile buttons from cfg.profiles and update label."""
-        # Clear existing buttons (if any)
-        for child in self.profile_buttons_frame.winfo_children():
-            child.destroy()
-
-        self.profile_var = tk.StringVar(value=self.current_profile_name)
-
-        col = 0
-        for profile_name, profile in self.cfg.profiles.items():
-            btn = ttk.Radiobutton(
-                self.profile_buttons_frame,
-                text=profile.display_name,
-                value=profile_name,
-                variable=self.profile_var,
-                command=lambda p=profile_name: self.on_profile_selected(p),
-            )
+        """
+        Sync profile buttons with cfg.profiles and update label.
+        Existing buttons are reused; only added/removed profiles touch Tk.
+        """
+        self.profile_var.set(self.current_profile_name)
+
+        # Drop buttons for profiles that no longer exist
+        for profile_name in list(self._profile_buttons):
+            if profile_name not in self.cfg.profiles:
+                self._profile_buttons.pop(profile_name).destroy()
+
+        for col, (profile_name, profile) in enumerate(self.cfg.profiles.items()):
+            btn = self._profile_buttons.get(profile_name)
+            if btn is None:
+                btn = ttk.Radiobutton(
+                    self.profile_buttons_frame,
+                    text=profile.display_name,
+                    value=profile_name,
+                    variable=self.profile_var,
+                    command=lambda p=profile_name: self.on_profile_selected(p),
+                )
+                self._profile_buttons[profile_name] = btn
+            elif btn.cget("text") != profile.display_name:
+                btn.configure(text=profile.display_name)
             btn.grid(row=0, column=col, padx=(0, 8))
-            col += 1
 
-        self._update_active_profile_label()
-
-    def _update_active_profile_label(self) -> None:
-        """Update the label that shows the currently active profile."""
-        profile = self.cfg.profiles.get(self.current_profile_name)
-        if profile:
-            self.active_profile_label.config(
-                text=f"Active profile: {profile.display_name} ({self.current_profile_name})"
-            )
-        else:
-            self.active_profile_label.config(
-                text=f"Active profile: {self.current_profile_name}"
-            )
+        self._refresh_chrome()
 
     def _update_admin_status_label(self) -> None:
         """Show if we are running as Administrator or not."""
@@ -249,30 +390,191 @@ class MainWindow(tk.Tk):
     def on_profile_selected(self, profile_name: str) -> None:
         """
         Called when user clicks a profile button.
-        Applies the profile (updates Windows Firewall) and reloads config.
+        Makes it the active profile in config, then enforces it in Windows
+        Firewall in the background and updates the UI once that is done.
         """
+        previous_profile = self.current_profile_name
         try:
-            apply_profile(profile_name)
-            # Reload config so self.cfg reflects any changes
-            self.cfg = load_config()
-            self.current_profile_name = self.cfg.active_profile
-            self.profile_var.set(self.current_profile_name)
-            self._update_active_profile_label()
-            self.refresh_apps_table()
-            self._update_status_bar()
-
-            log_event(
-                "PROFILE_APPLIED",
-                f"Applied profile '{profile_name}'",
-                {"profile": profile_name},
-            )
-        except Exception as exc:
-            print(f"[UI] Failed to apply profile '{profile_name}': {exc}")
+            # Config is only ever changed and saved here on the Tk thread;
+            # the worker just gets the profile name for the netsh sync.
+            set_active_profile(self.cfg, profile_name)
+        except ValueError as exc:
+            logger.warning("Failed to apply profile '%s': %s", profile_name, exc)
             log_event(
                 "ERROR",
                 f"Failed to apply profile '{profile_name}'",
                 {"profile": profile_name, "error": str(exc)},
             )
+            self.profile_var.set(self.current_profile_name)
+            self._request_logs_refresh()
+            return
+        # set_active_profile saved all of self.cfg
+        self._cancel_pending_save()
+
+        def on_done(exc: Optional[BaseException]) -> None:
+            if exc is not None:
+                logger.warning("Failed to apply profile '%s'", profile_name, exc_info=exc)
+                log_event(
+                    "ERROR",
+                    f"Failed to apply profile '{profile_name}'",
+                    {"profile": profile_name, "error": str(exc)},
+                )
+                # Go back to the profile that was in effect before
+                self.cfg.active_profile = previous_profile
+                self._schedule_save()
+                self.profile_var.set(self.current_profile_name)
+                self._request_logs_refresh()
+                return
+
+            with self.batch_ui():
+                self.current_profile_name = profile_name
+                self._active_profile = self._lookup_active_profile()
+                self._invalidate_status_map()
+                self.profile_var.set(self.current_profile_name)
+                self._refresh_chrome()
+                self.refresh_apps_table()
+
+                log_event(
+                    "PROFILE_APPLIED",
+                    f"Applied profile '{profile_name}'",
+                    {"profile": profile_name},
+                )
+            self._request_logs_refresh()
+
+        self._apply_profile_async(profile_name, on_done)
+
+    def _apply_profile_async(
+        self,
+        profile_name: str,
+        on_done: Callable[[Optional[BaseException]], None],
+    ) -> None:
+        """
+        Run sync_profile_to_windows_firewall(profile_name) (netsh calls; can
+        take seconds) on the firewall worker thread, then call on_done(exc
+        or None) on the Tk thread.
+        """
+        self._submit_firewall_sync(on_done, profile_name)
+
+    def _submit_firewall_sync(
+        self,
+        on_done: Callable[[Optional[BaseException]], None],
+        profile_name: str,
+        exe_paths: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Sync profile_name's rules to Windows Firewall on the firewall worker
+        thread: all of them, or only those of exe_paths. on_done(exc or None)
+        is called on the Tk thread afterwards. Jobs run one at a time, in
+        submission order, so a sync never overlaps another one.
+
+        The worker gets a snapshot of the rules it needs (taken here, on the
+        Tk thread) and never reads or writes config.json. Temporary allows it
+        found expired are cleared in self.cfg and saved on the Tk thread.
+        """
+        snapshot = self._firewall_snapshot(profile_name, exe_paths)
+        if exe_paths is None:
+            job = functools.partial(sync_profile_to_windows_firewall, profile_name, cfg=snapshot)
+        else:
+            job = functools.partial(
+                sync_app_rules_to_windows_firewall, profile_name, list(exe_paths), cfg=snapshot
+            )
+
+        self._set_firewall_busy(True)
+
+        def _finish(expired: Optional[List[str]], exc: Optional[BaseException]) -> None:
+            self._set_firewall_busy(False)
+            if exc is None and expired:
+                self._clear_expired_temp_allows(profile_name, expired)
+            on_done(exc)
+
+        self._submit(self._fw_executor, job, on_done=_finish)
+
+    def _firewall_snapshot(self, profile_name: str, exe_paths: Optional[List[str]]) -> FullConfig:
+        """
+        Minimal private copy of self.cfg for a firewall sync: the active
+        profile name and copies of profile_name's rules (only those of
+        exe_paths, if given). A missing profile is left out, so the sync
+        reports it.
+        """
+        profiles: Dict[str, ProfileConfig] = {}
+        profile = self.cfg.profiles.get(profile_name)
+        if profile is not None:
+            rules = profile.app_rules
+            if exe_paths is not None:
+                rules = {p: rules[p] for p in exe_paths if p in rules}
+            profiles[profile_name] = ProfileConfig(
+                name=profile.name,
+                display_name=profile.display_name,
+                description=profile.description,
+                default_action=profile.default_action,
+                app_rules={p: copy.copy(rule) for p, rule in rules.items()},
+            )
+        return FullConfig(
+            version=self.cfg.version,
+            active_profile=self.cfg.active_profile,
+            apps={},
+            profiles=profiles,
+        )
+
+    def _clear_expired_temp_allows(self, profile_name: str, exe_paths: List[str]) -> None:
+        """
+        Tk thread: clear temporary_until on the given rules of profile_name
+        if it has expired (or is invalid), as reported by a firewall sync.
+        """
+        profile = self.cfg.profiles.get(profile_name)
+        if profile is None:
+            return
+        now_epoch = int(time.time())
+        changed = False
+        for exe_path in exe_paths:
+            rule = profile.app_rules.get(exe_path)
+            if rule is None or not rule.temporary_until:
+                continue
+            until_epoch = rule.temporary_until_epoch
+            if until_epoch is None or now_epoch >= until_epoch:
+                rule.temporary_until = None
+                changed = True
+        if changed:
+            self._invalidate_status_map()
+            self._schedule_save()
+
+    def _submit(
+        self,
+        executor: ThreadPoolExecutor,
+        fn: Callable[..., object],
+        *args: object,
+        on_done: Callable[[object, Optional[BaseException]], None],
+    ) -> None:
+        """
+        Run fn(*args) on one of the window's executors and call
+        on_done(result, exc) on the Tk thread when it finishes (exc is None
+        on success). All background work goes through here.
+        """
+        future = executor.submit(fn, *args)
+
+        def _post_result(fut: Future) -> None:
+            # Runs on the worker thread; hop back to Tk before touching widgets
+            exc = fut.exception()
+            result = None if exc is not None else fut.result()
+            try:
+                self.after(0, on_done, result, exc)
+            except (RuntimeError, tk.TclError):
+                # Window was closed meanwhile
+                pass
+
+        future.add_done_callback(_post_result)
+
+    def _set_firewall_busy(self, busy: bool) -> None:
+        """
+        Busy cursor + disabled profile and rule-changing buttons while
+        firewall jobs are pending.
+        """
+        self._fw_jobs += 1 if busy else -1
+        pending = self._fw_jobs > 0
+        self.config(cursor="watch" if pending else "")
+        for btn in self._profile_buttons.values():
+            btn.state(["disabled"] if pending else ["!disabled"])  # type: ignore[attr-defined]
+        self._update_buttons_state()
 
     # ------------------------------------------------------------------
     # Apps handling
@@ -281,124 +583,322 @@ class MainWindow(tk.Tk):
     def refresh_apps(self) -> None:
         """
         Discover active apps, merge into cfg, save, and update UI list.
+
+        The (slow) process scan runs on a worker thread; the merge and all
+        UI updates happen back on the Tk thread in _apply_discovery_result.
         """
-        merge_discovered_apps_into_config(self.cfg)
-        save_config(self.cfg)
-        self.refresh_apps_table()
+        self.refresh_apps_button.state(["disabled"])
+        self._submit(self._bg_executor, _discover_apps, on_done=self._apply_discovery_result)
+
+    def _apply_discovery_result(
+        self,
+        discovered: Optional[List[AppInfo]],
+        exc: Optional[BaseException],
+    ) -> None:
+        """Tk thread: merge discovered apps into cfg and refresh the UI."""
+        from ..discovery import merge_discovered_apps_into_config
+
+        self.refresh_apps_button.state(["!disabled"])
+        if exc is not None or discovered is None:
+            logger.warning("App discovery failed", exc_info=exc)
+            return
+
+        merge_discovered_apps_into_config(self.cfg, discovered)
+        self._invalidate_sorted_apps()
+        _row_display_values.cache_clear()
+        self._schedule_save()
+        self._schedule_apps_refresh()
 
         # Record last refresh time for status bar
         self.last_apps_refresh = _dt.datetime.now().strftime("%H:%M:%S")
-        self._update_status_bar()
+        self._refresh_chrome()
 
         log_event("APPS_REFRESHED", "Discovered and merged active apps", {})
-
-    def refresh_apps_table(self) -> None:
-        """
-        Rebuild the Treeview rows from cfg.apps for the current profile.
-        """
-        # Clear existing items
-        for item in self.apps_tree.get_children():
-            self.apps_tree.delete(item)
-
-        # Determine active profile config
+        self._request_logs_refresh()
+
+    def _set_cfg(self, cfg: FullConfig) -> None:
+        """Replace self.cfg (e.g. after a reload) and drop views derived from it."""
+        if cfg is not self.cfg:
+            self.cfg = cfg
+            self._invalidate_sorted_apps()
+            self._active_profile = self._lookup_active_profile()
+            self._invalidate_status_map()
+
+    def _lookup_active_profile(self) -> ProfileConfig:
+        """ProfileConfig for current_profile_name in self.cfg (falls back to cfg's active one)."""
         profile = self.cfg.profiles.get(self.current_profile_name)
         if profile is None:
             # Fallback: try to restore active profile
             profile = get_active_profile(self.cfg)
+        return profile
+
+    def _get_sorted_apps(self) -> Tuple[AppInfo, ...]:
+        """
+        cfg.apps sorted by (name, exe_path), case-insensitive. Cached until
+        the app list changes (discovery merge or cfg replaced), so profile
+        switches and rule edits don't re-sort.
+        """
+        if self._sorted_apps_cache is None:
+            self._sorted_apps_cache = _sort_apps(list(self.cfg.apps.values()))
+        return self._sorted_apps_cache
 
-        now = _dt.datetime.utcnow()
+    def _invalidate_sorted_apps(self) -> None:
+        self._sorted_apps_cache = None
+        self._sort_epoch += 1
 
-        # Build rows
-        apps_list: List[AppInfo] = sorted(
-            self.cfg.apps.values(),
-            key=lambda a: (a.name.lower(), a.exe_path.lower()),
+    def _get_status_map(self, now_epoch: int) -> Dict[str, str]:
+        """
+        exe_path -> status column text ("ALLOW", "BLOCK", "ALLOW (TEMP)")
+        for every app rule of the active profile; apps without a rule
+        show the profile's default action. Built in one pass over the
+        rules and cached until the rules change (_invalidate_status_map)
+        or the earliest temporary allow in it expires.
+        """
+        expires = self._status_map_expires
+        if self._status_by_exe is not None and (expires is None or now_epoch < expires):
+            return self._status_by_exe
+
+        status_display_get = STATUS_DISPLAY.get
+        temp_status = STATUS_DISPLAY["temp"]
+        status_by_exe: Dict[str, str] = {}
+        expires = None
+        for exe_path, rule in self._active_profile.app_rules.items():
+            status = rule.action
+            if status == "block":
+                until_epoch = rule.temporary_until_epoch
+                if until_epoch is not None and now_epoch < until_epoch:
+                    # Temporarily allowed
+                    status_by_exe[exe_path] = temp_status
+                    if expires is None or until_epoch < expires:
+                        expires = until_epoch
+                    continue
+            status_by_exe[exe_path] = status_display_get(status) or status.upper()
+
+        self._status_by_exe = status_by_exe
+        self._status_map_expires = expires
+        return status_by_exe
+
+    def _invalidate_status_map(self) -> None:
+        self._status_by_exe = None
+
+    def _sort_apps_async(self) -> None:
+        """
+        Sort a snapshot of cfg.apps on a worker thread (large inventories),
+        then store it and refresh the table on the Tk thread. A sort that
+        is already running for the current epoch is not started twice.
+        """
+        epoch = self._sort_epoch
+        if self._sort_running_epoch == epoch:
+            return
+        self._sort_running_epoch = epoch
+        apps = list(self.cfg.apps.values())
+        self._submit(
+            self._bg_executor,
+            _sort_apps,
+            apps,
+            on_done=lambda result, exc: self._apply_sorted_apps(epoch, result, exc),
         )
 
-        for app in apps_list:
+    def _apply_sorted_apps(
+        self,
+        epoch: int,
+        result: Optional[Tuple[AppInfo, ...]],
+        exc: Optional[BaseException],
+    ) -> None:
+        if exc is not None or result is None:
+            logger.warning("Sorting apps failed", exc_info=exc)
+            self._sort_running_epoch = -1  # let the next refresh retry
+            return
+        if epoch != self._sort_epoch:
+            # cfg.apps changed meanwhile; a newer sort has been/will be requested
+            return
+        self._sorted_apps_cache = result
+        self._schedule_apps_refresh()
+
+    def refresh_apps_table(self) -> None:
+        """
+        Update the Treeview rows from cfg.apps for the current profile.
+        Existing rows are reused; only changed/new/removed rows touch Tk.
+        """
+        if self._defer_redraw("apps"):
+            return
+
+        # Active profile config (kept current by _set_cfg / profile changes)
+        profile = self._active_profile
+
+        now_epoch = int(time.time())
+
+        # Build rows (only the materialized prefix of the sorted list)
+        if self._sorted_apps_cache is None and len(self.cfg.apps) > SORT_OFFTHREAD_THRESHOLD:
+            # Keep the current rows until the sorted list is ready;
+            # _apply_sorted_apps calls back into this method.
+            self._sort_apps_async()
+            return
+        apps_list = self._get_sorted_apps()
+
+        default_status = STATUS_DISPLAY.get(profile.default_action) or profile.default_action.upper()
+
+        # Hot loop: bind lookups to locals once per refresh
+        status_get = self._get_status_map(now_epoch).get
+        row_values = _row_display_values
+
+        rows: List[Tuple[str, Tuple[str, str, str]]] = []
+        append = rows.append
+        for app in apps_list[:self._rows_limit]:
             exe_path = app.exe_path
-            rule = profile.app_rules.get(exe_path)
-            status_display: str
-
-            if rule is not None:
-                status = rule.action
-                temp_active = False
-
-                if rule.temporary_until and rule.action == "block":
-                    try:
-                        expiry = _dt.datetime.fromisoformat(rule.temporary_until)
-                        if now < expiry:
-                            # Temporarily allowed
-                            temp_active = True
-                    except ValueError:
-                        pass
-
-                if temp_active:
-                    status_display = "ALLOW (TEMP)"
-                else:
-                    status_display = status.upper()
-            else:
-                # No explicit rule; use default_action
-                status_display = profile.default_action.upper()
+            append((exe_path, row_values(app.name, exe_path, status_get(exe_path, default_status))))
 
-            self.apps_tree.insert(
-                "",
-                "end",
-                values=(app.name, exe_path, status_display),
-            )
+        self._apply_rows(rows)
 
-        # After repopulating, no app is selected by default
         self._update_buttons_state()
-        self._update_status_bar()
 
-    def _change_selected_apps_action(self, action: str) -> None:
+        # Run the pending layout/redraw for all row changes in one pass now,
+        # so the table is painted even if a slow call follows this refresh.
+        self.apps_tree.update_idletasks()
+
+    def _on_apps_yscroll(self, first: str, last: str) -> None:
+        """
+        apps_tree yscrollcommand: forward to the scrollbar, and when the
+        view reaches the end of the materialized rows, schedule loading
+        the next page of apps.
+        """
+        self._apps_vsb.set(first, last)
+        if (
+            float(last) >= 0.95
+            and self._rows_limit < len(self.cfg.apps)
+            and not self._page_load_pending
+        ):
+            self._page_load_pending = True
+            self.after_idle(self._load_next_page)
+
+    def _load_next_page(self) -> None:
+        self._page_load_pending = False
+        self._rows_limit += ROWS_PAGE_SIZE
+        self.refresh_apps_table()
+
+    def _apply_rows(self, rows: List[Tuple[str, Tuple[str, str, str]]]) -> None:
+        """
+        Make the tree show 'rows' ((exe_path, values) in display order) by
+        diffing against what it already shows: delete rows that are gone,
+        update values that changed, insert new rows in place, and only
+        move rows if the relative order of existing ones changed.
+
+        Inserts/updates/moves are collected as Tcl commands and run with a
+        single tk.call (see _run_tree_commands) rather than one call each.
+        """
+        tree = str(self.apps_tree)
+        row_by_exe = self._row_by_exe
+        row_values = self._row_values
+        new_order = [exe_path for exe_path, _ in rows]
+        new_set = set(new_order)
+
+        stale = [exe_path for exe_path in row_by_exe if exe_path not in new_set]
+        if stale:
+            self.apps_tree.delete(*(row_by_exe[exe_path] for exe_path in stale))
+            for exe_path in stale:
+                del self._exe_by_iid[row_by_exe.pop(exe_path)]
+                del row_values[exe_path]
+
+        reorder = (
+            [e for e in new_order if e in row_by_exe]
+            != [e for e in self._row_order if e in new_set]
+        )
+
+        commands: List[tuple] = []
+        for index, (exe_path, values) in enumerate(rows):
+            iid = row_by_exe.get(exe_path)
+            if iid is None:
+                self._next_row_id += 1
+                iid = f"app{self._next_row_id}"
+                tags = _STATUS_TAG.get(values[2], "")
+                commands.append((tree, "insert", "", index, "-id", iid, "-values", values, "-tags", tags))
+                row_by_exe[exe_path] = iid
+                self._exe_by_iid[iid] = exe_path
+                row_values[exe_path] = values
+                continue
+            if row_values[exe_path] != values:
+                tags = _STATUS_TAG.get(values[2], "")
+                commands.append((tree, "item", iid, "-values", values, "-tags", tags))
+                row_values[exe_path] = values
+            if reorder:
+                commands.append((tree, "move", iid, "", index))
+
+        self._run_tree_commands(commands)
+        self._row_order = new_order
+
+    def _run_tree_commands(self, commands: List[tuple]) -> None:
+        """
+        Run a batch of Tcl commands (each a tuple of words) in one round
+        trip. The batch goes over as a Tcl list, so names/paths containing
+        spaces, braces or quotes need no manual escaping.
+        """
+        if commands:
+            self.tk.call("apply", "{cmds} {foreach c $cmds {{*}$c}}", tuple(commands))
+
+    def _change_selected_apps_action(self, action: Action) -> None:
         """
         Helper to set allow/block for all selected apps in the current profile.
         """
         if self.current_profile_name not in self.cfg.profiles:
-            print(f"[UI] Current profile '{self.current_profile_name}' not found")
+            logger.warning("Current profile '%s' not found", self.current_profile_name)
             return
 
         selected = self.apps_tree.selection()
         if not selected:
             return
 
-        profile_name = self.current_profile_name
-        exe_paths_changed: List[str] = []
+        with self.batch_ui():
+            profile_name = self.current_profile_name
+            changes: List[Tuple[str, Action]] = []
+
+            exe_by_iid = self._exe_by_iid
+            for item_id in selected:
+                exe_path = exe_by_iid.get(item_id)
+                if exe_path is None:
+                    continue
+                changes.append((exe_path, action))
 
-        for item_id in selected:
-            values = self.apps_tree.item(item_id, "values")
-            if len(values) < 2:
-                continue
-            exe_path = values[1]
             try:
-                set_app_action_in_profile(self.cfg, profile_name, exe_path, action)  # type: ignore[arg-type]
-                exe_paths_changed.append(exe_path)
-            except Exception as exc:
-                print(f"[UI] Failed to set {action} for {exe_path}: {exc}")
+                # Apps that fail are logged and skipped; the rest are applied
+                exe_paths_changed = set_app_actions_in_profile(self.cfg, profile_name, changes)
+            except ValueError:
+                # Profile not found; nothing was changed
+                logger.warning("Failed to set %s for %d app(s)", action, len(changes), exc_info=True)
+                return
 
-        if not exe_paths_changed:
-            return
+            if not exe_paths_changed:
+                self._request_logs_refresh()
+                return
+            self._invalidate_status_map()
+
+            # Persist right away, then sync just the changed apps' firewall rules
+            self._save_now()
+
+            def on_done(exc: Optional[BaseException]) -> None:
+                if exc is not None:
+                    logger.warning(
+                        "Failed to sync firewall rules for profile '%s' after app rule changes",
+                        profile_name,
+                        exc_info=exc,
+                    )
+                    log_event(
+                        "ERROR",
+                        f"Failed to sync firewall rules for profile '{profile_name}' after app rule changes",
+                        {"profile": profile_name, "error": str(exc)},
+                    )
+                    self._request_logs_refresh()
+
+            self._submit_firewall_sync(on_done, profile_name, exe_paths_changed)
+
+            # Refresh UI (rules are already updated in self.cfg)
+            self._schedule_apps_refresh()
 
-        # Persist and apply profile (updates Windows Firewall)
-        save_config(self.cfg)
-        try:
-            apply_profile(profile_name)
-        except Exception as exc:
-            print(f"[UI] Failed to apply profile '{profile_name}' after app rule changes: {exc}")
             log_event(
-                "ERROR",
-                f"Failed to apply profile '{profile_name}' after app rule changes",
-                {"profile": profile_name, "error": str(exc)},
+                "APP_RULE_CHANGED",
+                f"Set {action.upper()} for {len(exe_paths_changed)} app(s) in profile '{profile_name}'",
+                {"profile": profile_name, "action": action, "apps": exe_paths_changed},
             )
-
-        # Refresh UI
-        self.refresh_apps_table()
-
-        log_event(
-            "APP_RULE_CHANGED",
-            f"Set {action.upper()} for {len(exe_paths_changed)} app(s) in profile '{profile_name}'",
-            {"profile": profile_name, "action": action, "apps": exe_paths_changed},
-        )
+            self._request_logs_refresh()
 
     def allow_selected_apps(self) -> None:
         """Allow selected apps (for current profile)."""
@@ -408,6 +908,95 @@ class MainWindow(tk.Tk):
         """Block selected apps (for current profile)."""
         self._change_selected_apps_action("block")
 
+    # ------------------------------------------------------------------
+    # Batched redraws
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def batch_ui(self) -> Iterator[None]:
+        """
+        Group several state changes into one redraw. Inside the block,
+        refresh_apps_table / refresh_logs / _refresh_chrome
+        only mark their part dirty; when the outermost block exits, each
+        dirty part is redrawn once at idle time. Blocks may nest.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._schedule_dirty_flush()
+
+    def _schedule_apps_refresh(self) -> None:
+        """
+        Refresh the apps table once at idle time. Use after mutations
+        instead of calling refresh_apps_table() directly, so back-to-back
+        changes cost a single refresh.
+        """
+        self._dirty.add("apps")
+        if self._batch_depth == 0:
+            self._schedule_dirty_flush()
+
+    def _schedule_dirty_flush(self) -> None:
+        if not self._dirty_flush_scheduled:
+            self._dirty_flush_scheduled = True
+            self.after_idle(self._flush_dirty)
+
+    def _defer_redraw(self, key: str) -> bool:
+        """Inside batch_ui: mark key dirty and return True (caller skips its redraw)."""
+        if self._batch_depth > 0:
+            self._dirty.add(key)
+            return True
+        return False
+
+    def _flush_dirty(self) -> None:
+        self._dirty_flush_scheduled = False
+        dirty, self._dirty = self._dirty, set()
+        if "chrome" in dirty:
+            self._refresh_chrome()
+        if "apps" in dirty:
+            self.refresh_apps_table()
+        if "logs" in dirty:
+            self.refresh_logs()
+
+    # ------------------------------------------------------------------
+    # Config persistence
+    # ------------------------------------------------------------------
+
+    def _schedule_save(self) -> None:
+        """
+        Mark self.cfg as needing a save. Bursts of changes within 250 ms
+        are coalesced into a single save_config() call.
+        """
+        if self._save_after_id is None:
+            self._save_after_id = self.after(250, self._flush_save)
+
+    def _flush_save(self) -> None:
+        """Write self.cfg to disk if a save is pending."""
+        if self._save_after_id is None:
+            return
+        self._save_now()
+
+    def _save_now(self) -> None:
+        """Write self.cfg to disk right away, dropping any pending debounced save."""
+        self._cancel_pending_save()
+        save_config(self.cfg)
+
+    def _cancel_pending_save(self) -> None:
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+            self._save_after_id = None
+
+    def _on_close(self) -> None:
+        """Window closed: don't lose a pending debounced save."""
+        self._flush_save()
+        # Firewall jobs already queued still finish before the process exits
+        self._fw_executor.shutdown(wait=False)
+        # Discovery/sort results are of no use once the window is gone
+        self._bg_executor.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
     # ------------------------------------------------------------------
     # Button state + status bar
     # ------------------------------------------------------------------
@@ -417,12 +1006,16 @@ class MainWindow(tk.Tk):
         Enable/disable buttons based on current selection in the apps tree.
         - Allow/Block: enabled if ≥1 app selected.
         - Why not working? / Temp Allow 1h: enabled if exactly 1 app selected.
+        Allow/Block/Temp Allow stay disabled while firewall jobs are pending
+        (see _set_firewall_busy), so a rule change can't target the profile
+        that is being switched away from.
         """
         selected = self.apps_tree.selection()
         count = len(selected)
 
         has_any = count >= 1
         single = count == 1
+        idle = self._fw_jobs == 0
 
         # Helper to set button state
         def set_btn_state(btn: ttk.Button, enabled: bool) -> None:
@@ -431,25 +1024,42 @@ class MainWindow(tk.Tk):
             else:
                 btn.state(["disabled"])
 
-        set_btn_state(self.allow_button, has_any)
-        set_btn_state(self.block_button, has_any)
+        set_btn_state(self.allow_button, has_any and idle)
+        set_btn_state(self.block_button, has_any and idle)
         set_btn_state(self.explain_button, single)
-        set_btn_state(self.temp_allow_button, single)
+        set_btn_state(self.temp_allow_button, single and idle)
 
-    def _update_status_bar(self) -> None:
+    def _refresh_chrome(self) -> None:
         """
-        Update the status bar with active profile, number of apps, and last refresh time.
+        Update the active-profile label and the status bar (active profile,
+        number of apps, last refresh time). Call after anything those show
+        changes: profile switch, app discovery, config load. Row repaints
+        don't touch them. Widgets whose text is unchanged aren't
+        reconfigured, so no relayout is queued for them.
         """
+        if self._defer_redraw("chrome"):
+            return
         active_profile = self.current_profile_name
+        profile = self.cfg.profiles.get(active_profile)
+        if profile:
+            label_text = f"Active profile: {profile.display_name} ({active_profile})"
+        else:
+            label_text = f"Active profile: {active_profile}"
+
         apps_count = len(self.cfg.apps)
         last_refresh = self.last_apps_refresh or "n/a"
-
-        text = (
+        status_text = (
             f"Profile: {active_profile} | "
             f"Apps listed: {apps_count} | "
             f"Last Refresh Apps: {last_refresh}"
         )
-        self.status_bar.config(text=text)
+
+        old_label, old_status = self._chrome_text
+        if label_text != old_label:
+            self.active_profile_label.config(text=label_text)
+        if status_text != old_status:
+            self.status_bar.config(text=status_text)
+        self._chrome_text = (label_text, status_text)
 
     # ------------------------------------------------------------------
     # "Why not working?" + temporary allow
@@ -464,20 +1074,19 @@ class MainWindow(tk.Tk):
             )
             return None
 
-        values = self.apps_tree.item(selected[0], "values")
-        if len(values) < 2:
-            return None
-        return values[1]
+        return self._exe_by_iid.get(selected[0])
 
     def explain_selected_app(self) -> None:
         exe_path = self._get_single_selected_exe_path()
         if not exe_path:
             return
 
+        # explain_app_in_active_profile reads config.json; include unsaved edits
+        self._flush_save()
         try:
             info = explain_app_in_active_profile(exe_path)
         except Exception as exc:
-            print(f"[UI] Failed to explain app '{exe_path}': {exc}")
+            logger.warning("Failed to explain app '%s'", exe_path, exc_info=True)
             messagebox.showerror(
                 "Error",
                 f"Could not determine why this app is not working:\n{exc}",
@@ -520,7 +1129,8 @@ class MainWindow(tk.Tk):
             "Continue?",
         ):
             try:
-                set_temporary_allow_in_active_profile(exe_path, minutes=60)
+                # In-memory only: saving and syncing happen below
+                rule_key = set_temporary_allow_in_active_profile(exe_path, minutes=60, cfg=self.cfg)
             except ValueError as exc:
                 messagebox.showinfo(
                     "Cannot temporarily allow",
@@ -528,39 +1138,114 @@ class MainWindow(tk.Tk):
                 )
                 return
             except Exception as exc:
-                print(f"[UI] Failed to set temporary allow for '{exe_path}': {exc}")
+                logger.warning("Failed to set temporary allow for '%s'", exe_path, exc_info=True)
                 messagebox.showerror(
                     "Error",
                     f"Failed to set temporary allow:\n{exc}",
                 )
                 return
+            self._invalidate_status_map()
+
+            # Persist right away and refresh view to show ALLOW (TEMP)
+            self._save_now()
+            self._schedule_apps_refresh()
+            self._request_logs_refresh()
+
+            def on_done(exc: Optional[BaseException]) -> None:
+                if exc is not None:
+                    logger.warning("Failed to set temporary allow for '%s'", exe_path, exc_info=exc)
+                    messagebox.showerror(
+                        "Error",
+                        f"Failed to set temporary allow:\n{exc}",
+                    )
+                    return
 
-            # Refresh view to show ALLOW (TEMP)
-            self.cfg = load_config()
-            self.refresh_apps_table()
+                messagebox.showinfo(
+                    "Temporary allow set",
+                    "This app is now temporarily allowed for 1 hour in the active profile.",
+                )
 
-            messagebox.showinfo(
-                "Temporary allow set",
-                "This app is now temporarily allowed for 1 hour in the active profile.",
-            )
+            # Re-sync this app's rule so the firewall unblocks it now (netsh):
+            # off the Tk thread
+            self._submit_firewall_sync(on_done, self.current_profile_name, [rule_key])
 
     # ------------------------------------------------------------------
     # Logs handling
     # ------------------------------------------------------------------
 
+    def _request_logs_refresh(self) -> None:
+        """
+        Schedule refresh_logs() 100 ms from now. Requests made before it
+        runs are folded into that one refresh, so bursts of events cost at
+        most one reload per window. (The Refresh Log button still calls
+        refresh_logs directly.)
+        """
+        if not self._logs_refresh_scheduled:
+            self._logs_refresh_scheduled = True
+            self.after(100, self._do_refresh_logs)
+
+    def _poll_logs(self) -> None:
+        """
+        Periodic log check. refresh_logs() returns after a stat when the
+        log file hasn't changed, so this is cheap while nothing happens.
+        """
+        self.refresh_logs()
+        self.after(LOG_POLL_MS, self._poll_logs)
+
+    def _do_refresh_logs(self) -> None:
+        self._logs_refresh_scheduled = False
+        self.refresh_logs()
+
     def refresh_logs(self) -> None:
         """
-        Reload logs and show them in the listbox.
+        Append events logged since the last refresh to the listbox (oldest
+        at the top), keeping at most LOG_LINES_SHOWN lines.
         """
-        events = get_recent_events(limit=200)
-        self.logs_list.delete(0, tk.END)
+        if self._defer_redraw("logs"):
+            return
+
+        # Nothing written since the last reload: keep the listbox as is
+        version = get_log_version()
+        if version == self._logs_version:
+            return
+        self._logs_version = version
+
+        last_ts = self._logs_last_ts
+        last_count = self._logs_last_ts_count
+        # since_ts is inclusive: the events at last_ts already shown come
+        # back too, so read that many extra and skip them
+        events = get_recent_events(limit=LOG_LINES_SHOWN + last_count, since_ts=last_ts)
+        skip = 0
+        if last_ts is not None:
+            while skip < len(events) and skip < last_count and events[skip].get("timestamp") == last_ts:
+                skip += 1
+        new_events = events[skip:]
+        if not new_events:
+            return
+
+        newest_ts = new_events[-1].get("timestamp", "")
+        same_ts = 0
+        for evt in reversed(events):
+            if evt.get("timestamp", "") != newest_ts:
+                break
+            same_ts += 1
+        if newest_ts == last_ts:
+            # (Can undercount only if >LOG_LINES_SHOWN events share one second)
+            same_ts = max(same_ts, last_count + len(new_events))
+        self._logs_last_ts = newest_ts
+        self._logs_last_ts_count = same_ts
+
+        lines = [
+            f"{evt.get('timestamp', '')} [{evt.get('event_type', '')}] {evt.get('message', '')}"
+            for evt in new_events
+        ]
 
-        for evt in events:
-            ts = evt.get("timestamp", "")
-            etype = evt.get("event_type", "")
-            msg = evt.get("message", "")
-            line = f"{ts} [{etype}] {msg}"
-            self.logs_list.insert(tk.END, line)
+        # One insert call for the new lines, one delete to drop the oldest
+        self.logs_list.insert(tk.END, *lines)
+        overflow = self.logs_list.size() - LOG_LINES_SHOWN
+        if overflow > 0:
+            self.logs_list.delete(0, overflow - 1)
+        self.logs_list.update_idletasks()
 
 
 def run() -> None:
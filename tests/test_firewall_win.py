@@ -0,0 +1,79 @@
+# tests/test_firewall_win.py
+
+import unittest
+from unittest import mock
+
+from firewall_assistant import firewall_win
+from firewall_assistant.models import AppRule, FullConfig, ProfileConfig
+
+EXE_A = "/opt/a/python.exe"
+EXE_B = "/opt/b/python.exe"
+
+
+def _config(rules):
+    profile = ProfileConfig(
+        name="normal",
+        display_name="Normal",
+        description="",
+        default_action="allow",
+        app_rules=rules,
+    )
+    return FullConfig(version=1, active_profile="normal", apps={}, profiles={"normal": profile})
+
+
+class SameBasenameTests(unittest.TestCase):
+    """Two different exes sharing a file name share FWAssist rule names."""
+
+    def setUp(self):
+        self.netsh_calls = []
+        patchers = [
+            mock.patch.object(firewall_win, "_run_netsh", side_effect=self.netsh_calls.append),
+            mock.patch.object(firewall_win, "log_event"),
+            mock.patch("builtins.print"),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _deletes(self):
+        return [args for args in self.netsh_calls if args[0] == "delete"]
+
+    def test_allow_app_only_deletes_rules_for_its_own_path(self):
+        firewall_win.allow_app(EXE_A)
+
+        deletes = self._deletes()
+        self.assertTrue(deletes)
+        for args in deletes:
+            self.assertIn(f"program={EXE_A}", args)
+            self.assertNotIn(f"program={EXE_B}", args)
+
+    def test_incremental_sync_leaves_other_same_basename_app_blocked(self):
+        cfg = _config({
+            EXE_A: AppRule(app_exe_path=EXE_A, action="allow"),
+            EXE_B: AppRule(app_exe_path=EXE_B, action="block"),
+        })
+
+        firewall_win.sync_app_rules_to_windows_firewall("normal", [EXE_A], cfg=cfg)
+
+        for args in self.netsh_calls:
+            self.assertNotIn(f"program={EXE_B}", args)
+        for args in self._deletes():
+            self.assertIn(f"program={EXE_A}", args)
+
+    def test_incremental_block_replaces_only_its_own_rules(self):
+        cfg = _config({
+            EXE_A: AppRule(app_exe_path=EXE_A, action="block"),
+            EXE_B: AppRule(app_exe_path=EXE_B, action="block"),
+        })
+
+        firewall_win.sync_app_rules_to_windows_firewall("normal", [EXE_A], cfg=cfg)
+
+        for args in self._deletes():
+            self.assertIn(f"program={EXE_A}", args)
+        adds = [args for args in self.netsh_calls if args[0] == "add"]
+        self.assertEqual(len(adds), 1)
+        self.assertIn(f"program={EXE_A}", adds[0])
+
+
+if __name__ == "__main__":
+    unittest.main()